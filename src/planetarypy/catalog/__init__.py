@@ -40,8 +40,6 @@ from planetarypy.catalog._index_resolver import (  # noqa: F401
 )
 from loguru import logger
 
-from planetarypy.config import config
-
 
 def build_catalog(force: bool = False) -> dict:
     """Build (or rebuild) the PDS catalog database from pdr-tests.
@@ -79,6 +77,7 @@ def build_catalog(force: bool = False) -> dict:
         insert_product_type,
         insert_product,
     )
+    from planetarypy.config import config
 
     storage_root = config.storage_root
 
@@ -263,6 +262,7 @@ def get_catalog() -> "duckdb.DuckDBPyConnection":
         (e.g. built with planetarypy ≤ 0.52).
     """
     from planetarypy.catalog._schema import get_connection, DB_FILENAME
+    from planetarypy.config import config
 
     db_path = config.storage_root / "catalog" / DB_FILENAME
     if not db_path.exists():
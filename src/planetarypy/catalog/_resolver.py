@@ -25,7 +25,6 @@ from pathlib import Path
 
 from loguru import logger
 
-from planetarypy.config import config
 from planetarypy.utils import url_retrieve
 
 
@@ -231,6 +230,8 @@ def default_product_dir(
     Exposed so a package's storage resolver can delegate to the default and
     then tweak it, rather than reimplementing the layout.
     """
+    from planetarypy.config import config
+
     safe_pid = product_id.replace("/", "_").replace("\\", "_")
     return config.storage_root / mission / instrument / product_type / safe_pid
 
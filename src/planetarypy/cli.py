@@ -2185,9 +2185,13 @@ def indexes_refresh(
     cache: str = typer.Option(None, "--cache",
                               help="Re-download a specific index's cumulative parquet.",
                               shell_complete=_shell_complete_index_key),
+    dynamic: bool = typer.Option(
+        False, "--dynamic",
+        help="Check all scraped (dynamic) indexes for new volumes, concurrently.",
+    ),
 ):
     """Refresh upstream index config or re-download a single index."""
-    if not config and not cache:
+    if not config and not cache and not dynamic:
         # No action requested → show help instead of a curt error so the
         # user can read the available switches in place.
         typer.echo(ctx.get_help())
@@ -2198,6 +2202,11 @@ def indexes_refresh(
         h = ConfigHandler(force_update=True)
         typer.echo(f"Refreshed upstream config → {h.path}")
 
+    if dynamic:
+        from planetarypy.pds.dynamic_index import check_for_updates
+        for key, available in check_for_updates(force=True).items():
+            typer.echo(f"{key}: {'update available' if available else 'up to date'}")
+
     if cache:
         from planetarypy.pds import Index
         _require_index_key(cache)
@@ -3017,7 +3026,7 @@ def _plugin_manifest(ep):
     if not module_path:
         return None
 
-    candidates = [module_path, module_path.split(".")[0]]
+    candidates = [module_path, module_path.split(".", 1)[0]]
     for name in candidates:
         module = sys.modules.get(name)
         if module is None:
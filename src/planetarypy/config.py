@@ -7,10 +7,35 @@ __all__ = ["config", "Config"]
 
 import json
 import os
-from functools import reduce
+import tomllib
+from collections.abc import Mapping
+from functools import cache, cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import tomlkit
+if TYPE_CHECKING:
+    import tomlkit
+
+# Written for new installs with ``storage_root`` already resolved, so a fresh
+# file is complete and ``Config._read_config`` has nothing to backfill.
+_DEFAULT_CONFIG_TOML = """\
+# PlanetaryPy Configuration
+
+# Root directory for storing all planetarypy data
+
+storage_root = {storage_root}
+
+# Suppress upstream DeprecationWarning during CLI execution
+# (e.g. Typer's shell_complete= deprecation notice).
+# Devs developing planetarypy can set this to false to see
+# deprecation notices as reminders to track upstream.
+filter_deprecation_warnings = true
+
+# Row-count threshold above which row-display commands
+# (e.g. `plp indexes select`) switch from the transposed
+# Rich table to CSV. Lower it if your terminal is narrow.
+max_table_rows = 3
+"""
 
 
 class Config:
@@ -34,40 +59,22 @@ class Config:
             self._create_default_config()
         self._read_config()
 
+    @staticmethod
+    def _default_storage_root() -> Path:
+        """Create and return the default data directory."""
+        path = Path.home() / "planetarypy_data"
+        path.mkdir(exist_ok=True)
+        return path
+
     def _create_default_config(self):
         """Create a minimal default config file with documented defaults."""
-        doc = tomlkit.document()
-        doc.add(tomlkit.comment("PlanetaryPy Configuration"))
-        doc.add(tomlkit.nl())
-        doc.add(tomlkit.comment("Root directory for storing all planetarypy data"))
-        doc.add(tomlkit.nl())
-        doc["storage_root"] = ""  # Empty string will be updated during _read_config
-        doc.add(tomlkit.nl())
-        doc.add(tomlkit.comment(
-            "Suppress upstream DeprecationWarning during CLI execution"
-        ))
-        doc.add(tomlkit.comment(
-            "(e.g. Typer's shell_complete= deprecation notice)."
-        ))
-        doc.add(tomlkit.comment(
-            "Devs developing planetarypy can set this to false to see"
-        ))
-        doc.add(tomlkit.comment(
-            "deprecation notices as reminders to track upstream."
-        ))
-        doc["filter_deprecation_warnings"] = True
-        doc.add(tomlkit.nl())
-        doc.add(tomlkit.comment(
-            "Row-count threshold above which row-display commands"
-        ))
-        doc.add(tomlkit.comment(
-            "(e.g. `plp indexes select`) switch from the transposed"
-        ))
-        doc.add(tomlkit.comment(
-            "Rich table to CSV. Lower it if your terminal is narrow."
-        ))
-        doc["max_table_rows"] = 3
-        self.path.write_text(tomlkit.dumps(doc))
+        from planetarypy.utils import _toml_string, atomic_write
+
+        storage_root = _toml_string(str(self._default_storage_root()))
+        text = _DEFAULT_CONFIG_TOML.format(storage_root=storage_root)
+        # If another process creates the file first, its copy is kept
+        with atomic_write(self.path) as tmp:
+            tmp.write_bytes(text.encode("utf-8"))
 
     def _read_config(self):
         """Read the configfile and store config dict.
@@ -75,12 +82,27 @@ class Config:
         `storage_root` will be stored as attribute. Backfills new
         default-bearing keys that aren't present in older config files
         so users see the available knobs next time they open the file.
+
+        Lookups go through a plain dict from ``tomllib``; the
+        style-preserving ``tomlkit`` document is only parsed once
+        something needs to be written back.
         """
-        self.tomldoc = tomlkit.loads(self.path.read_text())
+        # TOML is always UTF-8, whatever the platform's default encoding
+        self._text = self.path.read_bytes().decode("utf-8")
+        self._data = tomllib.loads(self._text)
+        self.__dict__.pop("tomldoc", None)
+        if (
+            self._data.get("storage_root")
+            and "filter_deprecation_warnings" in self._data
+            and "max_table_rows" in self._data
+        ):
+            self.storage_root = Path(self._data["storage_root"])
+            return
+        import tomlkit
+
         dirty = False
         if not self.tomldoc.get("storage_root"):
-            path = Path.home() / "planetarypy_data"
-            path.mkdir(exist_ok=True)
+            path = self._default_storage_root()
             self.tomldoc["storage_root"] = str(path)
             self.storage_root = path
             dirty = True
@@ -121,27 +143,42 @@ class Config:
         if dirty:
             self.save()
 
+    @cached_property
+    def tomldoc(self) -> "tomlkit.TOMLDocument":
+        """Style-preserving TOML document, parsed on first edit."""
+        import tomlkit
+
+        return tomlkit.loads(self._text)
+
     @property
     def d(self):
         """Get the Python dictionary from the TOML document."""
-        return self.tomldoc
+        # Once the document exists it may hold unsaved edits, so read from it.
+        return self.__dict__.get("tomldoc", self._data)
 
     def __getitem__(self, key: str):
         """Get sub-dictionary by nested key."""
-        try:
-            return reduce(lambda c, k: c[k], key.split("."), self.d)
-        except KeyError:
-            return ""
+        return self.get_value(key)
 
     def get_value(
         self,
         key: str,  # A nested key in dotted format
     ) -> str:  # Returning empty string if not existing, because Path('') is False which is handy
         """Get sub-dictionary by nested key."""
-        try:
-            return reduce(lambda c, k: c[k], key.split("."), self.d)
-        except KeyError:
-            return ""
+        # Misses are a normal outcome (optional settings), so branch on them
+        # instead of raising and catching a KeyError per lookup.
+        current = self.d
+        if "." not in key:
+            # Top-level settings like ``storage_root`` are the common case
+            value = current.get(key)
+            return "" if value is None else value
+        for k in key.split("."):
+            if not isinstance(current, Mapping):
+                return ""
+            current = current.get(k)
+            if current is None:
+                return ""
+        return current
 
     def set_value(
         self,
@@ -150,13 +187,16 @@ class Config:
         save: bool = True,  # Switch to control writing out to disk
     ):
         """Set value in sub-dic using dotted key."""
+        import tomlkit
+
         dic = self.tomldoc
         keys = nested_key.split(".")
         for key in keys[:-1]:
             # Create the parent dictionaries if they don't exist
-            if key not in dic:
-                dic[key] = {}
-            dic = dic[key]
+            child = dic.get(key)
+            if child is None:
+                child = dic[key] = tomlkit.table()
+            dic = child
         dic[keys[-1]] = value
         if save:
             self.save()
@@ -166,12 +206,50 @@ class Config:
         self.set_value(nested_key, value)
 
     def save(self):
-        """Write the TOML doc to file."""
-        self.path.write_text(tomlkit.dumps(self.tomldoc))
+        """Write the TOML doc to file, replacing it atomically."""
+        import tomlkit
+
+        from planetarypy.utils import atomic_write
+
+        self._text = tomlkit.dumps(self.tomldoc)
+        with atomic_write(self.path, overwrite=True) as tmp:
+            tmp.write_bytes(self._text.encode("utf-8"))
+
+    def to_json(self) -> str:
+        """Return all settings as indented JSON."""
+        # Plain builtins instead of tomlkit items: json handles them without
+        # per-node fallbacks, and TOML dates get a readable string form.
+        d = self.d
+        if type(d) is not dict:
+            d = d.unwrap()
+        return json.dumps(d, indent=2, default=str)
+
+    def __str__(self) -> str:
+        return self.to_json()
+
+    def __repr__(self) -> str:
+        """Return a concise string representation of this Config."""
+        # Cheap on purpose: debuggers and tracebacks call it a lot
+        return f"<Config path={str(self.path)!r} keys={list(self.d)}>"
 
-    def __repr__(self):
-        return json.dumps(self.d, indent=2)
 
+@cache
+def _default_config() -> Config:
+    """The shared ``Config`` instance, read on first use."""
+    return Config()
 
-# Create a singleton instance
-config = Config()
+
+# Declared for linters and type checkers only; with no value bound, lookups
+# still fall through to the module ``__getattr__`` below.
+config: Config
+
+
+def __getattr__(name: str):
+    """Serve the ``config`` singleton lazily.
+
+    Reading (or on a new install, creating) the config file and the storage
+    directory waits until something uses the settings, not just an import.
+    """
+    if name == "config":
+        return _default_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
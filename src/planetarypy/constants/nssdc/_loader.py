@@ -107,8 +107,9 @@ def load_archive() -> dict:
         path = _local_archive_path()
         if not path.is_file():
             _download_from_zenodo(path)
-    with gzip.open(path, "rt", encoding="utf-8") as f:
-        return json.load(f)
+    # json decodes the UTF-8 bytes in one pass, without a text wrapper
+    with gzip.open(path, "rb") as f:
+        return json.loads(f.read())
 
 
 # ── Unit coercion ──────────────────────────────────────────────────────
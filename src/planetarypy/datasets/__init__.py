@@ -225,7 +225,7 @@ def stac_search(coll: "StacCollection", *, bbox=None, lon=None, lat=None,
     ``bbox`` is ``(west, south, east, north)`` in degrees; or pass ``lon``/``lat``
     for a point (expanded to a tiny box, since STAC rejects a zero-area bbox).
     """
-    import requests
+    from planetarypy.utils import http_session
 
     if bbox is None:
         if lon is None or lat is None:
@@ -237,7 +237,7 @@ def stac_search(coll: "StacCollection", *, bbox=None, lon=None, lat=None,
         "bbox": ",".join(str(v) for v in bbox),
         "limit": int(limit),
     }
-    resp = requests.get(f"{coll.stac_url}/search", params=params, timeout=60)
+    resp = http_session().get(f"{coll.stac_url}/search", params=params, timeout=60)
     resp.raise_for_status()
     return _items_from_features(resp.json().get("features", []), coll)
 
@@ -248,9 +248,9 @@ def stac_items(coll: "StacCollection", *, limit: int = 50) -> "list[StacItem]":
     Hits the STAC ``/collections/{id}/items`` endpoint. ``limit`` caps how many are
     returned (the endpoint paginates; this fetches the first page).
     """
-    import requests
+    from planetarypy.utils import http_session
 
-    resp = requests.get(
+    resp = http_session().get(
         f"{coll.stac_url}/collections/{coll.collection}/items",
         params={"limit": int(limit)}, timeout=60,
     )
@@ -264,9 +264,9 @@ def stac_collections(stac_url: str) -> "list[dict]":
     E.g. ``stac_collections("https://stac.astrogeology.usgs.gov/api")`` lists every
     USGS Astrogeology collection — the ids you'd register as a :class:`StacCollection`.
     """
-    import requests
+    from planetarypy.utils import http_session
 
-    resp = requests.get(f"{stac_url}/collections", timeout=60)
+    resp = http_session().get(f"{stac_url}/collections", timeout=60)
     resp.raise_for_status()
     return [
         {"id": c.get("id"), "title": c.get("title"),
@@ -3,9 +3,8 @@
 
 
 from loguru import logger
-from pandas import DataFrame
 
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
 from planetarypy.pds.index_main import Index, InventoryIndex
 from planetarypy.pds.meta_display import register_meta_handler
@@ -25,6 +24,9 @@ from planetarypy.pds.utils import (
     rebuild_pid_cache,
 )
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 __all__ = [
     "Index",
     "IndexKeyError",
@@ -52,7 +54,7 @@ __all__ = [
 
 # Process-level cache of fully-loaded index frames, keyed by dotted index key.
 # Populated and consulted by get_index; cleared with clear_index_cache.
-_INDEX_CACHE: dict[str, DataFrame] = {}
+_INDEX_CACHE: dict[str, "DataFrame"] = {}
 
 
 def clear_index_cache(dotted_index_key: str | None = None) -> None:
@@ -85,7 +87,7 @@ def get_index(
     pids: Iterable[str] | None = None,
     columns: Iterable[str] | None = None,
     prefix: bool = False,
-) -> DataFrame:
+) -> "DataFrame":
     """Retrieve a specific index file .
 
     A check is made for possible updates to the index file once per day.
@@ -356,7 +358,7 @@ def read_pids_file(
 
 
 def missing_pids(
-    df: DataFrame,
+    df: "DataFrame",
     dotted_index_key: str,
     pids: Iterable[str],
 ) -> list[str]:
@@ -392,7 +394,7 @@ def missing_pids(
 def resolve_pids(
     dotted_index_key: str,
     pids: Iterable[str],
-    df: DataFrame,
+    df: "DataFrame",
     *,
     prefix: bool = False,
 ) -> dict[str, list[str]]:
@@ -3,12 +3,20 @@
 These are the codes for web-scraped PDS archive pages to discover the most recent
 volume delivery with a new index file and its URL.
 """
-__all__ = ["DYNAMIC_URL_HANDLERS", "DynamicRemoteHandler"]
+__all__ = [
+    "DYNAMIC_URL_HANDLERS",
+    "DynamicRemoteHandler",
+    "check_for_updates",
+    "discover_latest_url",
+]
+
+from datetime import datetime
 
 from loguru import logger
 
+from ..utils import parallel_map
 from .dynamic_url_handlers import CTXIndex, LROCIndex, LAMPEDRIndex, LAMPRDRIndex
-from .index_logging import AccessLog
+from .index_logging import AccessLog, batch_logs
 
 # Dynamic URL handlers registry
 DYNAMIC_URL_HANDLERS = {
@@ -19,6 +27,42 @@ DYNAMIC_URL_HANDLERS = {
 }
 
 
+def discover_latest_url(index_key: str) -> str | None:
+    """Scrape the archive for the latest index label URL of a dynamic index.
+
+    Looks the handler up in ``DYNAMIC_URL_HANDLERS`` and touches no logs, so
+    it is safe to call from worker threads.
+
+    Returns
+    -------
+    str or None
+        The URL, or None if the scrape failed.
+
+    Raises
+    ------
+    ValueError
+        If no handler is registered for ``index_key``.
+    """
+    handler_class = DYNAMIC_URL_HANDLERS.get(index_key)
+    if not handler_class:
+        raise ValueError(f"No dynamic handler available for {index_key}")
+
+    try:
+        logger.debug(
+            f"Discovering latest URL for {index_key} using {handler_class.__name__}"
+        )
+        handler = handler_class()
+        latest_url = str(handler.latest_index_label_url)
+        return latest_url if latest_url else None
+
+    # What a failed scrape raises: network errors (URLError and timeouts are
+    # OSErrors), pandas finding no table, or a listing of unexpected shape.
+    # Anything else is a bug in the handler and should surface as one.
+    except (OSError, ValueError, IndexError, KeyError, ImportError) as e:
+        logger.error(f"Error discovering URL for {index_key}: {e}")
+        return None
+
+
 class DynamicRemoteHandler:
     """Manages dynamic index URLs and their discovery/caching.
 
@@ -32,12 +76,16 @@ class DynamicRemoteHandler:
     ----------
     index_key : str
         The dotted index key (e.g. "mro.ctx.edr").
+    check : bool
+        Whether to check the remote right away if the last check is older
+        than a day. ``check_for_updates`` turns this off to run the checks
+        of several indexes concurrently.
     """
 
-    def __init__(self, index_key : str):
+    def __init__(self, index_key : str, check: bool = True):
         self.key = index_key
         self.log = AccessLog(key=index_key)
-        if self.should_check:
+        if check and self.should_check:
             self._check_for_updates()
 
     @property
@@ -57,34 +105,29 @@ class DynamicRemoteHandler:
         This method only discovers and returns the URL - it does NOT update any logs.
         Logging is handled by the caller based on what they want to do with the URL.
         """
-        key = self.key
-        handler_class = self.handler_class
-        if not handler_class:
-            raise ValueError(f"No dynamic handler available for {key}")
-
-        try:
-            logger.debug(
-                f"Discovering latest URL for {key} using {handler_class.__name__}"
-            )
-            handler = handler_class()
-            latest_url = str(handler.latest_index_label_url)
-            return latest_url if latest_url else None
-
-        except Exception as e:
-            logger.error(f"Error discovering URL for {key}: {e}")
-            return None
+        return discover_latest_url(self.key)
 
     def _check_for_updates(self) -> None:
         """Check for new URLs and log if an update is available."""
-        latest_url = self.discover_latest_url()
+        self._record_latest_url(self.discover_latest_url())
+
+    def _record_latest_url(self, latest_url: str | None) -> None:
+        """Log the outcome of a discovery against the cached URL.
 
+        Every outcome advances ``last_checked`` in the access log; the URL
+        fields are only rewritten when they actually change.
+        """
         if not latest_url:
             logger.warning(f"No URL discovered for {self.key}")
             return
 
         current = self.log.current_url
 
-        if not current:
+        if self.log.update_available and latest_url == self.log.available_url:
+            # Update already flagged and not downloaded yet - nothing new
+            logger.debug(f"Update for {self.key} still pending: {latest_url}")
+            self.log.log_check_time()
+        elif not current:
             # First time - no local cache yet
             # Store the URL as available_url so it can be used for download
             logger.info(f"First discovery for {self.key}: {latest_url}")
@@ -142,3 +185,47 @@ class DynamicRemoteHandler:
             return self.discover_latest_url()
 
         return None
+
+
+def check_for_updates(
+    keys=None, workers: int = 4, force: bool = False
+) -> dict[str, bool]:
+    """Check several dynamic indexes for new volumes concurrently.
+
+    Each discovery scrapes a remote archive listing, so they are run in a
+    thread pool and the total wait is roughly that of the slowest archive.
+    Indexes checked within the last day are skipped, as in
+    :class:`DynamicRemoteHandler`. Only the scraping runs in the workers;
+    the results are logged on the calling thread, in a single write of the
+    access log.
+
+    Parameters
+    ----------
+    keys : iterable of str, optional
+        Dotted index keys to check. Defaults to all of ``DYNAMIC_URL_HANDLERS``.
+    workers : int
+        Thread pool size.
+    force : bool
+        Check every index, however recently it was last checked.
+
+    Returns
+    -------
+    dict[str, bool]
+        Whether an update is available, per index key.
+    """
+    keys = list(DYNAMIC_URL_HANDLERS) if keys is None else list(keys)
+    handlers = {key: DynamicRemoteHandler(key, check=False) for key in keys}
+    now = datetime.now()
+    due = [
+        key for key, handler in handlers.items() if force or handler.log.is_due(now)
+    ]
+
+    results = parallel_map(discover_latest_url, due, workers=workers)
+    with batch_logs(handlers[key].log for key in due):
+        for key, latest_url, error in results:
+            if error is not None:
+                # Scrape failures come back as None; this is a bug, don't hide it
+                raise error
+            handlers[key]._record_latest_url(latest_url)
+
+    return {key: bool(handler.log.update_available) for key, handler in handlers.items()}
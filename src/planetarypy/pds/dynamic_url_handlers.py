@@ -3,14 +3,55 @@
 
 __all__ = ["CTXIndex", "LROCIndex", "LAMPEDRIndex", "LAMPRDRIndex"]
 
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from io import StringIO
+from typing import TYPE_CHECKING
+
 from loguru import logger
-from yarl import URL
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _read_html(url: str, **kwargs) -> list["pd.DataFrame"]:
+    """``pd.read_html`` on a page fetched through the shared HTTP session.
+
+    Given a URL, pandas would open it with urllib: a fresh connection per
+    listing, no retries and no timeout. Fetching it ourselves reuses the
+    pooled keep-alive connections of ``http_session()``.
+    """
+    import pandas as pd
+
+    from planetarypy.utils import headers, http_session
+
+    response = http_session().get(url, headers=headers(), timeout=60)
+    response.raise_for_status()
+    return pd.read_html(StringIO(response.text), **kwargs)
+
+
+def _read_listing(url: str, stop: int | None = None) -> "pd.DataFrame":
+    """Read the name column of an Apache-style directory listing page.
+
+    The listing's icon/description columns and its horizontal-rule rows come
+    back all-NaN and are dropped; the first remaining row is the header
+    separator, so the slice starts at 1. Only the first (name) column is kept
+    because it is the only one the handlers ever look at. ``flavor="lxml"``
+    pins the parser we ship as a dependency instead of letting pandas probe
+    for bs4/html5lib first.
+    """
+    return (
+        _read_html(url, flavor="lxml")[0]
+        .dropna(how="all", axis=1)
+        .dropna(how="all", axis=0)
+        .iloc[1:stop, :1]
+    )
 
 
 class CTXIndex:
     url = "https://planetarydata.jpl.nasa.gov/img/data/mro/ctx/"
     backup_url = "https://pdsimage2.wr.usgs.gov/Mars_Reconnaissance_Orbiter/CTX"
+    # Seconds the primary gets to answer before the backup is asked as well.
+    hedge_delay = 0.1
 
     def __init__(self):
         self._volumes_table = None
@@ -19,40 +60,55 @@ class CTXIndex:
     @property
     def volumes_table(self):
         if self._volumes_table is None:
-            # Try primary URL first
-            try:
-                self._volumes_table = (
-                    pd.read_html(self.url)[0]
-                    .dropna(how="all", axis=1)
-                    .dropna(how="all", axis=0)
-                    .iloc[1:, :-1]
-                )
-                self._successful_url = self.url
-            except Exception as e:
-                # If primary URL fails, try backup URL
-                logger.warning(
-                    f"Failed to fetch CTX volumes table from primary URL {self.url}: {e}. "
-                    f"Trying backup URL {self.backup_url}."
-                )
-                try:
-                    self._volumes_table = (
-                        pd.read_html(self.backup_url)[0]
-                        .dropna(how="all", axis=1)
-                        .dropna(how="all", axis=0)
-                        .iloc[1:, :-1]
-                    )
-                    self._successful_url = self.backup_url
-                    logger.info(
-                        "Successfully fetched CTX volumes table from backup URL"
-                    )
-                except Exception as backup_error:
-                    logger.error(
-                        "Failed to fetch CTX volumes table from backup URL "
-                        f"{self.backup_url}: {backup_error}"
-                    )
-                    raise backup_error
+            self._volumes_table, self._successful_url = self._fetch_hedged()
         return self._volumes_table
 
+    def _fetch_hedged(self):
+        """Fetch the volumes listing, racing the backup against a slow primary.
+
+        The primary gets ``hedge_delay`` seconds on its own, so a healthy
+        primary answers without any backup traffic. If it has failed or is
+        still pending by then, the backup is requested too and whichever
+        listing arrives first wins; a primary that is merely slow no longer
+        costs its full timeout before the backup is tried.
+
+        Returns
+        -------
+        tuple[pandas.DataFrame, str]
+            The volumes table and the URL it was read from.
+        """
+        pool = ThreadPoolExecutor(max_workers=2)
+        try:
+            futures = {pool.submit(_read_listing, self.url): self.url}
+            done, _ = wait(futures, timeout=self.hedge_delay)
+            if not done or next(iter(done)).exception() is not None:
+                futures[pool.submit(_read_listing, self.backup_url)] = self.backup_url
+            errors = {}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    table = future.result()
+                except Exception as e:
+                    errors[url] = e
+                    if url == self.url:
+                        logger.warning(
+                            f"Failed to fetch CTX volumes table from primary URL {self.url}: {e}. "
+                            f"Waiting for the backup request to {self.backup_url}."
+                        )
+                    continue
+                if url == self.backup_url:
+                    logger.info("Successfully fetched CTX volumes table from backup URL")
+                return table, url
+        finally:
+            # Don't block on the losing request; its result is discarded.
+            pool.shutdown(wait=False, cancel_futures=True)
+        backup_error = errors[self.backup_url]
+        logger.error(
+            "Failed to fetch CTX volumes table from backup URL "
+            f"{self.backup_url}: {backup_error}"
+        )
+        raise backup_error
+
     @property
     def latest_release_folder(self):
         return self.volumes_table.iloc[-2, 0]
@@ -65,7 +121,7 @@ class CTXIndex:
     def latest_index_label_url(self):
         # Use the successful URL (primary or backup) for constructing the label URL
         base_url = self._successful_url if self._successful_url else self.url
-        return URL(base_url) / f"{self.latest_release_folder}index/cumindex.lbl"
+        return f"{base_url.rstrip('/')}/{self.latest_release_folder}index/cumindex.lbl"
 
 
 class _LAMPIndexBase:
@@ -84,7 +140,7 @@ class _LAMPIndexBase:
     @property
     def volumes_table(self):
         if self._volumes_table is None:
-            df = pd.read_html(self.url)[1]  # table 1 is the file listing
+            df = _read_html(self.url, flavor="lxml")[1]  # table 1 is the file listing
             # Filter to volume directories only (LROLAM_NNNN/)
             mask = df["Name"].str.match(r"LROLAM_\d{4}/", na=False)
             self._volumes_table = df[mask].reset_index(drop=True)
@@ -100,7 +156,7 @@ class _LAMPIndexBase:
 
     @property
     def latest_index_label_url(self):
-        return URL(self.url) / f"{self.latest_release_folder}INDEX/CUMINDEX.LBL"
+        return f"{self.url.rstrip('/')}/{self.latest_release_folder}INDEX/CUMINDEX.LBL"
 
 
 class LAMPEDRIndex(_LAMPIndexBase):
@@ -120,12 +176,7 @@ class LROCIndex:
     @property
     def volumes_table(self):
         if self._volumes_table is None:
-            self._volumes_table = (
-                pd.read_html(self.edr_url)[0]
-                .dropna(how="all", axis=1)
-                .dropna(how="all", axis=0)
-                .iloc[1:-1, :-1]
-            )
+            self._volumes_table = _read_listing(self.edr_url, stop=-1)
         return self._volumes_table
 
     @property
@@ -138,4 +189,4 @@ class LROCIndex:
 
     @property
     def latest_index_label_url(self):
-        return URL(self.edr_url) / f"{self.latest_release_folder}INDEX/CUMINDEX.LBL"
+        return f"{self.edr_url.rstrip('/')}/{self.latest_release_folder}INDEX/CUMINDEX.LBL"
@@ -6,10 +6,10 @@ before parsing) or a DataFrame-level fixer (applied after parsing but before
 time conversions).
 """
 
+import mmap
+import re
 from pathlib import Path
 from loguru import logger
-import pandas as pd
-import numpy as np
 
 
 def replace_in_dataframe(df, old_text, new_text, columns=None, regex=False, inplace=False):
@@ -19,7 +19,7 @@ def replace_in_dataframe(df, old_text, new_text, columns=None, regex=False, inpl
     ----------
     df : pandas.DataFrame
         DataFrame to operate on.
-    old_text : str
+    old_text : str or re.Pattern
         Text or pattern to replace.
     new_text : str
         Replacement text.
@@ -37,21 +37,29 @@ def replace_in_dataframe(df, old_text, new_text, columns=None, regex=False, inpl
     pandas.DataFrame
         DataFrame with replacements applied.
     """
+    import pandas as pd
+
     target_df = df if inplace else df.copy()
     if columns is None:
-        # Use columns with string/object dtype or that support .str accessor
-        try:
-            cols = [c for c in target_df.columns if hasattr(target_df[c], "str")]
-        except Exception:
-            cols = list(target_df.columns)
+        # Only text columns can hold the pattern; numeric ones are never copied
+        cols = target_df.select_dtypes(
+            include=["object", "string", "category"]
+        ).columns.tolist()
     else:
         cols = list(columns)
+    if regex and isinstance(old_text, str):
+        # Compiled once for all columns, and shared by the match test and the rewrite
+        old_text = re.compile(old_text)
 
     for col in cols:
         try:
-            target_df[col] = (
-                target_df[col].astype("string").str.replace(old_text, new_text, regex=regex)
-            )
+            s = target_df[col]
+            if not isinstance(s.dtype, pd.StringDtype):
+                s = s.astype("string")
+            # A match test is cheaper than a rewrite, and most columns have none
+            if not s.str.contains(old_text, regex=regex, na=False).any():
+                continue
+            target_df[col] = s.str.replace(old_text, new_text, regex=regex)
         except Exception as e:
             logger.debug(f"replace_in_dataframe: skipped column {col}: {e}")
             continue
@@ -61,6 +69,11 @@ def replace_in_dataframe(df, old_text, new_text, columns=None, regex=False, inpl
 def replace_in_file(filename: str | Path, old_text: str, new_text: str) -> None:
     """Simple in-place text replacement in a file.
 
+    The file is scanned through ``mmap`` and only rewritten if ``old_text``
+    occurs in it. The rewrite streams in chunks into a temp file that then
+    replaces the original, so index tables of hundreds of MB are never held
+    in memory. Bytes are kept as they are, line endings included.
+
     Parameters
     ----------
     filename : str or Path
@@ -69,17 +82,59 @@ def replace_in_file(filename: str | Path, old_text: str, new_text: str) -> None:
         Text to replace.
     new_text : str
         Replacement text.
+
+    Raises
+    ------
+    ValueError
+        If ``old_text`` is empty; it would match between every two bytes.
     """
-    filename = str(filename)
-    with open(filename, "r") as file:
-        content = file.read()
-    new_content = content.replace(old_text, new_text)
-    if new_content != content:
-        with open(filename, "w") as file:
-            file.write(new_content)
-        logger.debug(f"Replaced '{old_text}' with '{new_text}' in {filename}")
-    else:
+    from planetarypy.utils import atomic_write
+
+    if not old_text:
+        raise ValueError("replace_in_file needs a non-empty old_text")
+    filename = Path(filename)
+    old = old_text.encode("utf-8")
+    new = new_text.encode("utf-8")
+    with filename.open("rb") as f:
+        # mmap refuses empty files, which can't contain anything anyway
+        found = filename.stat().st_size > 0 and _mmap_find(f, old)
+    if not found:
         logger.debug(f"No occurrences of '{old_text}' found in {filename}")
+        return
+    with atomic_write(filename, overwrite=True) as tmp:
+        with filename.open("rb") as src, tmp.open("wb") as dst:
+            _stream_replace(src, dst, old, new)
+    logger.debug(f"Replaced '{old_text}' with '{new_text}' in {filename}")
+
+
+def _mmap_find(f, old: bytes) -> bool:
+    """Whether ``old`` occurs in the open file ``f``, without reading it in."""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm.find(old) != -1
+
+
+def _stream_replace(src, dst, old: bytes, new: bytes, chunk_size: int = 1 << 20) -> None:
+    """Copy ``src`` to ``dst`` in chunks, replacing ``old`` with ``new``.
+
+    The last ``len(old) - 1`` bytes of a chunk are carried over to the next
+    one, so a match split across two chunks is still found. Matches are
+    replaced left to right without overlaps, like ``bytes.replace``.
+    """
+    keep = len(old) - 1
+    pending = b""
+    while chunk := src.read(chunk_size):
+        buf = pending + chunk
+        # No match starting at or after ``safe`` can be complete yet
+        safe = len(buf) - keep
+        pos = 0
+        while (i := buf.find(old, pos)) != -1 and i < safe:
+            dst.write(buf[pos:i])
+            dst.write(new)
+            pos = i + len(old)
+        end = max(pos, safe)
+        dst.write(buf[pos:end])
+        pending = buf[end:]
+    dst.write(pending.replace(old, new))
 
 
 def fix_mer_rdr_df(df):
@@ -99,17 +154,28 @@ def fix_mer_rdr_df(df):
     pandas.DataFrame
         Fixed DataFrame.
     """
-    logger.debug("Applying DataFrame-level fix for MER Pancam RDR index.")
-    df = df.copy()
+    import pandas as pd
 
-    tcols = [col for col in df.columns if "TIME" in col]
-    for col in tcols:
-        df[col] = df[col].apply(
-            lambda x: x + "Z" if isinstance(x, str) and not x.endswith("Z") else x
-        )
+    logger.debug("Applying DataFrame-level fix for MER Pancam RDR index.")
+    # Shallow: fixed columns are replaced, never written into, so only those
+    # get copied and the caller's frame stays untouched
+    df = df.copy(deep=False)
 
-    if "RELEASE_ID" in df.columns:
-        df["RELEASE_ID"] = pd.to_numeric(df["RELEASE_ID"], errors="coerce")
+    for col in df.columns:
+        if col == "RELEASE_ID":
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+            continue
+        if "TIME" not in col:
+            continue
+        s = df[col]
+        if not pd.api.types.is_object_dtype(s) and not pd.api.types.is_string_dtype(s):
+            continue  # e.g. an all-NaN float column: no strings to fix
+        # Vectorized: non-strings count as done, so only strings get the "Z"
+        missing_z = ~s.str.endswith("Z", na=True)
+        if missing_z.any():
+            fixed = s.copy()
+            fixed[missing_z] = s[missing_z] + "Z"
+            df[col] = fixed
 
     return df
 
@@ -141,23 +207,23 @@ def fix_lro_lola_rdr_df(df):
     pandas.DataFrame
         Modified DataFrame with ``PRODUCT_CREATION_TIME`` parsed to datetimes.
     """
+    import pandas as pd
+
     logger.debug(
         "Applying DataFrame-level fix for lro.lola.rdr index PRODUCT_CREATION_TIME column."
     )
-    df = df.copy()
+    # Shallow: the column is replaced, not written into
+    df = df.copy(deep=False)
     col = "PRODUCT_CREATION_TIME"
     if col in df.columns:
-        def fix_time(val):
-            if pd.isna(val):
-                return np.nan
-            val = str(val).strip()
-            if not val:
-                return np.nan
-            if len(val) == 10 and val.count("-") == 2:
-                val = val + "T00:00:00"
-            return val
-        df[col] = df[col].apply(fix_time)
-        df[col] = pd.to_datetime(df[col], format="%Y-%m-%dT%H:%M:%S", errors="coerce")
+        # Vectorized; to_datetime's cache parses each distinct string only once,
+        # and a creation-time column repeats the same few values a lot.
+        s = df[col].astype("string").str.strip()
+        date_only = ((s.str.len() == 10) & (s.str.count("-") == 2)).fillna(False)
+        s = s.mask(date_only, s + "T00:00:00")
+        df[col] = pd.to_datetime(
+            s, format="%Y-%m-%dT%H:%M:%S", errors="coerce", cache=True
+        )
     return df
 
 
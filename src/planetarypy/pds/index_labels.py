@@ -14,9 +14,7 @@ __all__ = [
 # Temporarily suppress PendingDeprecationWarning from pvl.collections.Units
 # This can be removed once pvl version > 1.3.2 is used
 import warnings
-
-import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING
 
 # pvl 1.3.2 triggers its own PendingDeprecationWarning on import
 # (pvl internally uses Units instead of Quantity). Fixed in pvl main
@@ -27,10 +25,12 @@ with warnings.catch_warnings():
     import pvl
 from pathlib import Path
 from loguru import logger
-from tqdm.auto import tqdm
 
 from .. import datetime_format_converters as tformats
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 warnings.filterwarnings("ignore", category=PendingDeprecationWarning, module="pvl")
 
 
@@ -200,6 +200,9 @@ class IndexLabel:
 
 
 def _convert_times(df):
+    import numpy as np
+    import pandas as pd
+
     missing_strings = [r"^UNK\s*$", r"^NULL\s*$", r"^N/A\s*$", r"^NA\s*$", r"^NONE\s*$"]
     for column in [col for col in df.columns if "TIME" in col]:
         if column in ["LOCAL_TIME", "DWELL_TIME"] or column.startswith("NTV"):
@@ -256,6 +259,9 @@ def index_to_df(
     In conjunction with an IndexLabel object that figures out the column widths,
     this reader should work for all PDS TAB files.
     """
+    import pandas as pd
+    from tqdm.auto import tqdm
+
     from .index_fixes import apply_file_fixer, apply_pre_time_df_fixer
 
     indexpath = Path(indexpath)
@@ -309,7 +315,7 @@ def decode_line(
 
 def find_mixed_type_cols(
     # Dataframe to be searched for mixed data-types
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     # Switch to control if NaN values in these problem columns should be replaced by the
     # string 'UNKNOWN'
     fix: bool = True,
@@ -1,18 +1,41 @@
-"""Logging handlers for PDS index access timestamps and URL discoveries."""
+"""Logging handlers for PDS index access timestamps and URL discoveries.
 
+The log lives in ``~/.planetarypy_index_log.toml`` by default; set
+``PLANETARYPY_INDEX_LOG`` to use another location. A path ending in
+``.sqlite`` or ``.db`` opts into :class:`SqliteAccessLog`, which writes one
+row per update instead of rewriting the whole TOML file — worthwhile when
+many indexes are tracked.
+"""
 
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime as dt
 from datetime import timedelta
 from pathlib import Path
 
 from loguru import logger
 
-from planetarypy.utils import NestedTomlDict
+from planetarypy.utils import NestedTomlDict, _split_key, toml_dumps, write_toml
+
+SQLITE_SUFFIXES = (".sqlite", ".db")
+
+# Serializes the read-merge-write in AccessLog._write across threads
+_WRITE_LOCK = threading.Lock()
+
+# One connection per SQLite log, shared by all its instances and threads.
+# Separate connections in one process would lock each other out.
+_SQLITE_CONNECTIONS: dict[Path, sqlite3.Connection] = {}
+_SQLITE_LOCK = threading.Lock()
 
 
 class AccessLog(NestedTomlDict):
     """Handler for index log operations.
 
+    Constructing an ``AccessLog`` while ``FILE_PATH`` has one of the
+    :data:`SQLITE_SUFFIXES` returns a :class:`SqliteAccessLog` instead.
+
     Parameters
     ----------
     key : str
@@ -20,25 +43,82 @@ class AccessLog(NestedTomlDict):
     """
 
     ONEDAY = timedelta(days=1)
-    FILE_PATH = Path.home() / ".planetarypy_index_log.toml"
+    FILE_PATH = Path(
+        os.getenv("PLANETARYPY_INDEX_LOG", Path.home() / ".planetarypy_index_log.toml")
+    ).expanduser()
+
+    def __new__(cls, *args, **kwargs):
+        if cls is AccessLog and AccessLog.FILE_PATH.suffix in SQLITE_SUFFIXES:
+            cls = SqliteAccessLog
+        return super().__new__(cls)
 
     def __init__(self, key):
-        super().__init__(self.FILE_PATH)
         self.key = key
+        if key is None:
+            super().__init__(self.FILE_PATH)
+            return
+        # A keyed log only ever reads and writes its own entry (see _write),
+        # so take that from the shared parse, which is redone only when the
+        # file's mtime or size changed, instead of a tomlkit parse per index.
+        # It is kept in plain dicts: lookups then skip tomlkit's item wrappers.
+        self.file_path = self.FILE_PATH
+        self.doc = {}
+        entry = NestedTomlDict(self.file_path, read_only=True).get(key) or {}
+        for field, value in entry.items():
+            if not isinstance(value, dict):
+                self.set(key, field, value)
+
+    def _write(self):
+        """Write this key's entry into the log file as it is on disk now.
+
+        Every index has its own ``AccessLog`` instance on the same file, each
+        holding the document as it was when it was constructed. Writing that
+        whole document back would undo entries other instances have saved
+        since, e.g. from the background config check, so only our own
+        entry is merged in.
+        """
+        if self.key is None:
+            return super()._write()
+        self._write_entries([self])
+
+    @staticmethod
+    def _write_entries(logs: list["AccessLog"]) -> None:
+        """Merge the entries of several keyed logs into the file in one write."""
+        file_path = logs[0].file_path
+        with _WRITE_LOCK:
+            # The shared parse is only read: copy the tables along each key
+            doc = dict(NestedTomlDict(file_path, read_only=True).doc)
+            changed = False
+            for log in logs:
+                own = log.get(log.key)
+                table = doc
+                for part in _split_key(log.key):
+                    table[part] = table = dict(table.get(part) or {})
+                before = dict(table)
+                table.update(own or {})
+                changed = changed or table != before
+            if not changed:
+                # E.g. a second check within the same second: nothing to write
+                return
+            # A log file has no formatting to keep, so skip tomlkit here
+            write_toml(file_path, doc)
 
-    def _log_time(self, time_type):
-        """Log a timestamp for a given key and time type."""
-        self.set(self.key, time_type, dt.now().replace(microsecond=0))
+    def _log_time(self, time_type, now: dt | None = None):
+        """Log a timestamp for a given key and time type.
+
+        Pass ``now`` to stamp several fields with one clock reading.
+        """
+        self.set(self.key, time_type, (now or dt.now()).replace(microsecond=0))
         self.save()
         logger.debug(
             f"Logged {time_type} for {self.key} at {self.get(self.key, time_type)}"
         )
 
-    def log_check_time(self):
-        self._log_time("last_checked")
+    def log_check_time(self, now: dt | None = None):
+        self._log_time("last_checked", now)
 
-    def log_update_time(self):
-        self._log_time("last_updated")
+    def log_update_time(self, now: dt | None = None):
+        self._log_time("last_updated", now)
 
     def log_current_url(self, url: str):
         """Log the URL of the currently cached/downloaded index."""
@@ -47,9 +127,10 @@ class AccessLog(NestedTomlDict):
 
     def log_available_url(self, url: str):
         """Log the URL of an available update."""
-        self.set(self.key, "available_url", str(url))
-        self.log_update_available(True)
-        self.log_check_time()
+        with self.batch():
+            self.set(self.key, "available_url", str(url))
+            self.log_update_available(True)
+            self.log_check_time()
         logger.debug(f"Logged available update URL for {self.key}: {url}")
 
     def log_remote_check(self, server_last_modified: dt):
@@ -73,6 +154,25 @@ class AccessLog(NestedTomlDict):
                  server_last_modified.replace(microsecond=0))
         self.log_check_time()
 
+    def log_validators(self, etag: str | None, last_modified: str | None):
+        """Remember the HTTP cache validators of the last full response.
+
+        Not saved on its own; the check or update timestamp logged next
+        writes it out together with them.
+        """
+        if etag:
+            self.set(self.key, "etag", etag)
+        if last_modified:
+            self.set(self.key, "last_modified", last_modified)
+
+    @property
+    def etag(self) -> str | None:
+        return self.get(self.key, "etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.get(self.key, "last_modified")
+
     def _log_yesterday_check(self):
         """Set the last check time to yesterday to force a check on next access."""
         yesterday = dt.now() - self.ONEDAY - timedelta(minutes=1)
@@ -108,6 +208,13 @@ class AccessLog(NestedTomlDict):
     def last_update(self):
         return self.get(self.key, "last_updated")
 
+    @property
+    def last_activity(self) -> dt | None:
+        """The later of ``last_checked`` and ``last_updated``, from one lookup."""
+        entry = self.get(self.key) or {}
+        stamps = [entry.get("last_checked"), entry.get("last_updated")]
+        return max((t for t in stamps if t is not None), default=None)
+
     @property
     def time_since_last_check(self) -> dt | None:
         """Return time delta since last check, or None if never checked."""
@@ -119,10 +226,14 @@ class AccessLog(NestedTomlDict):
     @property
     def should_check(self) -> bool:
         """Determine if a check should be performed (if last check was over one day ago)."""
+        return self.is_due()
+
+    def is_due(self, now: dt | None = None) -> bool:
+        """Like :attr:`should_check`, against a clock reading shared by the caller."""
         last = self.last_check
         if last is None:
             return True
-        return self.time_since_last_check > self.ONEDAY
+        return (now or dt.now()) - last > self.ONEDAY
 
     @property
     def _should_check_minute(self) -> bool:
@@ -130,7 +241,7 @@ class AccessLog(NestedTomlDict):
         last = self.last_check
         if last is None:
             return True
-        return self.time_since_last_check > timedelta(minutes=1)
+        return dt.now() - last > timedelta(minutes=1)
 
     def _delete(self):
         """Delete the index log file."""
@@ -146,5 +257,169 @@ class AccessLog(NestedTomlDict):
         else:
             return self.dumps()
 
-    def __repr__(self):
-        return self.__str__()
+    def __repr__(self) -> str:
+        """Key and file path only; unlike ``__str__`` it never reads the log."""
+        return f"<{type(self).__name__} key={self.key!r} path={str(self.FILE_PATH)!r}>"
+
+
+@contextmanager
+def batch_logs(logs):
+    """Like :meth:`AccessLog.batch`, for several logs at once.
+
+    Saves of the keyed TOML logs are deferred and then written to the log
+    file together, instead of one rewrite of the whole file per log.
+
+    Example:
+        >>> with batch_logs(handler.log for handler in handlers):
+        ...     for handler in handlers:
+        ...         handler.log.log_check_time()  # deferred
+        >>> # file written once here
+    """
+    logs = list(logs)
+    for log in logs:
+        log._batch_depth += 1
+    try:
+        yield logs
+    finally:
+        merged = []
+        for log in logs:
+            log._batch_depth -= 1
+            if log._batch_depth or not log._dirty:
+                continue
+            log._dirty = False
+            if log.key is None or isinstance(log, SqliteAccessLog):
+                log._write()
+            else:
+                merged.append(log)
+        if merged:
+            AccessLog._write_entries(merged)
+
+
+def _sqlite_connection(path: Path, schema: str) -> sqlite3.Connection:
+    """The process-wide connection to the SQLite log at ``path``.
+
+    Opened once, in autocommit mode and usable from any thread; statements
+    on it are serialized with ``_SQLITE_LOCK``.
+    """
+    with _SQLITE_LOCK:
+        conn = _SQLITE_CONNECTIONS.get(path)
+        if conn is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(schema)
+            _SQLITE_CONNECTIONS[path] = conn
+        return conn
+
+
+class SqliteAccessLog(AccessLog):
+    """:class:`AccessLog` stored in an SQLite database.
+
+    Each ``set`` is a single-row upsert, committed right away, so the cost
+    of an update does not grow with the number of logged indexes and no
+    write transaction is left open between calls. All instances on a file
+    share one connection (see :func:`_sqlite_connection`); WAL mode lets
+    other processes keep reading while one writes.
+
+    Values keep their Python type across the round trip (datetime, bool or
+    str), matching what the TOML-backed log returns.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS log (
+            key TEXT NOT NULL,
+            field TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (key, field)
+        )
+    """
+
+    def __init__(self, key):
+        self.file_path = self.FILE_PATH
+        self.key = key
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return _sqlite_connection(self.file_path, self._SCHEMA)
+
+    def _execute(self, sql: str, params=()) -> list:
+        """Run one statement on the shared connection and fetch its rows."""
+        conn = self.conn
+        with _SQLITE_LOCK:
+            return conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _encode(value) -> tuple[str, str]:
+        if isinstance(value, bool):
+            return "bool", "1" if value else "0"
+        if isinstance(value, dt):
+            return "datetime", value.isoformat()
+        return "str", str(value)
+
+    @staticmethod
+    def _decode(kind: str, value: str):
+        if kind == "bool":
+            return value == "1"
+        if kind == "datetime":
+            return dt.fromisoformat(value)
+        return value
+
+    def set(self, dotted_key: str, field: str, value) -> None:
+        kind, text = self._encode(value)
+        self._execute(
+            "INSERT INTO log VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(key, field) DO UPDATE "
+            "SET kind = excluded.kind, value = excluded.value",
+            (dotted_key, field, kind, text),
+        )
+
+    def get(self, dotted_key: str, field: str | None = None):
+        if field is None:
+            rows = self._execute(
+                "SELECT field, kind, value FROM log WHERE key = ?", (dotted_key,)
+            )
+            if not rows:
+                return None
+            return {f: self._decode(k, v) for f, k, v in rows}
+        rows = self._execute(
+            "SELECT kind, value FROM log WHERE key = ? AND field = ?",
+            (dotted_key, field),
+        )
+        return self._decode(*rows[0]) if rows else None
+
+    def to_dict(self) -> dict:
+        """Return the log as the same nested dict the TOML file would hold."""
+        doc: dict = {}
+        for key, field, kind, value in self._execute(
+            "SELECT key, field, kind, value FROM log ORDER BY key, field"
+        ):
+            table = doc
+            for part in _split_key(key):
+                table = table.setdefault(part, {})
+            table[field] = self._decode(kind, value)
+        return doc
+
+    def dumps(self) -> str:
+        return toml_dumps(self.to_dict())
+
+    def _write(self) -> None:
+        """Nothing to do: every ``set`` is already committed."""
+
+    def _delete(self):
+        """Delete the index log database."""
+        with _SQLITE_LOCK:
+            conn = _SQLITE_CONNECTIONS.pop(self.file_path, None)
+            if conn is not None:
+                conn.close()
+        if self.FILE_PATH.is_file():
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{self.FILE_PATH}{suffix}").unlink(missing_ok=True)
+            logger.info(f"Deleted index log file: {self.FILE_PATH}")
+        else:
+            logger.warning(f"Index log file does not exist: {self.FILE_PATH}")
+
+    def __str__(self):
+        return self.dumps()
+
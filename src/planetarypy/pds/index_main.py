@@ -8,12 +8,10 @@ __all__ = ["Index", "InventoryIndex"]
 import csv
 from pathlib import Path
 
-import pandas as pd
 from loguru import logger
 from yarl import URL
 
-from ..config import config
-from ..utils import atomic_write, have_internet, url_retrieve
+from ..utils import atomic_write, have_internet, parallel_map, url_retrieve
 from .dynamic_index import (
     DYNAMIC_URL_HANDLERS,  # registry of dynamic index handlers
     DynamicRemoteHandler,
@@ -61,6 +59,8 @@ class Index:
 
     def _default_local_dir(self) -> Path:
         """Get default local directory for this index."""
+        from ..config import config
+
         return (
             Path(config.storage_root)
             / f"{self.mission}/{self.instrument}/indexes/{self.indexname}"
@@ -116,8 +116,11 @@ class Index:
     @property
     def label_filename(self):
         """Get the label filename from URL."""
-        if self.url:
-            return Path(str(self.url).split("/")[-1])
+        # One lookup: for a dynamic index without logged URLs, each one
+        # may have to scrape the remote
+        url = self.url
+        if url:
+            return Path(str(url).split("/")[-1])
         else:
             # Find label files using Path.glob()
             label_files = list(self.local_dir.glob("*.lbl")) + list(
@@ -191,32 +194,41 @@ class Index:
             logger.error(f"No URL available for {self.index_key}")
             return False
         try:
-            # Download label file
+            # Label and table are independent, so fetch them side by side:
+            # the small label no longer adds its round trips to the table's.
             logger.info(
                 f"Downloading {self.index_key} label from {url} and related table."
             )
-            url_retrieve(url, self.local_label_path)
-
-            # Download table file
             logger.debug(f"Downloading {self.index_key} table from {self.table_url}")
-            url_retrieve(self.table_url, self.local_table_path)
+            jobs = [
+                (url, self.local_label_path, 0),
+                (self.table_url, self.local_table_path, 1),
+            ]
+            for _, _, error in parallel_map(
+                lambda job: url_retrieve(job[0], job[1], tqdm_position=job[2]),
+                jobs,
+                workers=2,
+            ):
+                if error is not None:
+                    raise error
 
             logger.info(f"Successfully downloaded {self.index_key} files")
 
             if convert_to_parquet:
                 self.convert_to_parquet()
 
-            # Log the successful update
-            self.remote.log.log_update_time()
+            # Log the successful update, written out once for all three fields
+            with self.remote.log.batch():
+                self.remote.log.log_update_time()
 
-            # Record what we actually downloaded, for every remote type. This
-            # used to be dynamic-only, which left static indexes with no record
-            # of their provenance — `plp indexes info` could then only report
-            # the *available* URL and had nothing to compare it against.
-            self.remote.log.log_current_url(url)
+                # Record what we actually downloaded, for every remote type. This
+                # used to be dynamic-only, which left static indexes with no record
+                # of their provenance — `plp indexes info` could then only report
+                # the *available* URL and had nothing to compare it against.
+                self.remote.log.log_current_url(url)
 
-            # Clear the update_available flag since we just downloaded
-            self.remote.log.log_update_available(False)
+                # Clear the update_available flag since we just downloaded
+                self.remote.log.log_update_available(False)
 
         except Exception as e:
             # Must re-raise: every caller proceeds to use the files this was
@@ -292,6 +304,8 @@ class Index:
     @property
     def dataframe(self):
         """Get the index data as a pandas DataFrame from parquet cache."""
+        import pandas as pd
+
         return pd.read_parquet(self.local_parq_path)
 
     def refresh_remote(self):
@@ -350,6 +364,8 @@ class InventoryIndex(Index):
                         }
                     )
 
+        import pandas as pd
+
         self.target_per_row = pd.DataFrame(rows)
         logger.info(f"Read {len(self.target_per_row)} observations with target lists")
         return self.target_per_row
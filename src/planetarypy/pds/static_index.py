@@ -4,8 +4,17 @@ This module handles indexes with fixed URLs that are managed through configurati
 Update logic focuses on checking for newer file timestamps at known stable URLs.
 """
 
+import atexit
 import datetime
+import os
+import random
+import threading
+import time
+import tomllib
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from urllib.request import URLError
 from loguru import logger
 from yarl import URL
@@ -14,12 +23,20 @@ from .. import utils
 from .index_logging import AccessLog
 
 
+@lru_cache(maxsize=1024)
+def _parse_url(url: str) -> URL:
+    """Parse a URL string once; ``URL`` objects are immutable and shared."""
+    return URL(url)
+
 
 class ConfigHandler(utils.NestedTomlDict):
     """Handler for the statix index URLs configuration file.
 
     - Download from planetarypy config repo if it is not present.
-    - Check once per day if there's an updated version available.
+    - Check once per day if there's an updated version available. The check
+      runs in a background thread so it doesn't hold up the caller; the
+      updated file is picked up by the next ``ConfigHandler``. Set
+      ``PLANETARYPY_SYNC_CONFIG_CHECK=1`` to check in the foreground instead.
     - Read out the URLs for the static indexes, based on dotted keys like "mro.ctx.edr".
 
     Parameters
@@ -29,37 +46,153 @@ class ConfigHandler(utils.NestedTomlDict):
 
     """
     FNAME = "planetarypy_index_urls.toml"
-    BASE_URL = URL(
+    BASE_URL = (
         "https://raw.githubusercontent.com/planetarypy/planetarypy_configs/refs/heads/main/"
     )
-    CONFIG_URL = BASE_URL / FNAME
+    CONFIG_URL = BASE_URL + FNAME
     CONFIG_PATH = Path.home() / f".{FNAME}"
+    UPDATE_INTERVAL = datetime.timedelta(days=1)
+    UPDATE_JITTER = datetime.timedelta(hours=2)
+
+    # Seconds interpreter exit waits for a background check still running
+    EXIT_WAIT = 5.0
+
+    _background_check: threading.Thread | None = None
+    _background_path: Path | None = None
+    _exit_hook_registered = False
+    # (parsed doc, flat urls) of the last handler that built ``urls``
+    _urls_cache: tuple[dict, Mapping[str, str]] | None = None
+    _background_lock = threading.Lock()
 
     def __init__(self, local_path: str | None = None, force_update: bool = False):
         self.path = Path(local_path) if local_path else self.CONFIG_PATH
-        self.log = AccessLog("indexes.static.config")
 
         if not self.path.is_file():
-            logger.info(f"Downloading fresh static config from {self.CONFIG_URL}.")
-            utils.url_retrieve(str(self.CONFIG_URL), self.path, disable_tqdm=True)
-            self.log.log_update_time()
-        elif force_update or self.should_update:
+            self._download_config()
+        elif force_update:
             self._check_and_update_config()
+        elif not self._recently_replaced() and self.should_update:
+            self._start_update_check()
+
+        # Never written back from here, so skip tomlkit's style-preserving parse
+        super().__init__(self.path, read_only=True)
 
-        super().__init__(self.path)
+    @cached_property
+    def log(self) -> AccessLog:
+        """Access log entry for the config's downloads and checks."""
+        return AccessLog("indexes.static.config")
+
+    def _recently_replaced(self) -> bool:
+        """Whether the config file was written too recently to be due a check.
+
+        One ``stat`` instead of reading the access log, for the common case
+        of a file downloaded within the last day. Checks that found nothing
+        new leave the file alone, so an older file still needs the log.
+        """
+        age = time.time() - self.path.stat().st_mtime
+        return age < (self.UPDATE_INTERVAL - self.UPDATE_JITTER).total_seconds()
+
+    def _download_config(self):
+        """Fetch the config for a fresh install, keeping its cache validators.
+
+        Recording ``ETag``/``Last-Modified`` right away lets the first daily
+        check already be a conditional request.
+        """
+        logger.info(f"Downloading fresh static config from {self.CONFIG_URL}.")
+        # Against a missing local file any non-empty download is an "update"
+        result = utils.compare_remote_file(self.CONFIG_URL, self.path)
+        if result["error"] or result["remote_tmp_path"] is None:
+            raise ConnectionError(
+                f"Could not download {self.CONFIG_URL}: {result['error'] or 'empty file'}"
+            )
+        # Validate before the raw bytes land: a broken file at ``self.path``
+        # would not be downloaded again, since only missing files are
+        tmp_path = result["remote_tmp_path"]
+        try:
+            with tmp_path.open("rb") as f:
+                tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            tmp_path.unlink(missing_ok=True)
+            raise ConnectionError(
+                f"Downloaded an invalid config from {self.CONFIG_URL}: {e}"
+            ) from e
+        tmp_path.replace(self.path)
+        self.log.log_validators(result.get("etag"), result.get("last_modified"))
+        self.log.log_update_time()
+
+    def _start_update_check(self):
+        """Run the daily update check in a daemon thread, one per process.
+
+        At interpreter exit a running check gets ``EXIT_WAIT`` seconds to
+        finish; see :meth:`_finish_update_check`.
+        """
+        if os.getenv("PLANETARYPY_SYNC_CONFIG_CHECK") == "1":
+            self._check_and_update_config()
+            return
+        cls = type(self)
+        with cls._background_lock:
+            if cls._background_check is not None and cls._background_check.is_alive():
+                return
+            if not cls._exit_hook_registered:
+                atexit.register(cls._finish_update_check)
+                cls._exit_hook_registered = True
+            cls._background_path = self.path
+            cls._background_check = threading.Thread(
+                target=self._check_and_update_config,
+                name="planetarypy-config-check",
+                daemon=True,
+            )
+            cls._background_check.start()
+
+    @classmethod
+    def _finish_update_check(cls) -> None:
+        """Let a running check finish, or remove its partial download.
+
+        A daemon thread is killed mid-way at interpreter exit, which would
+        leave the ``.remote_tmp`` download behind and the check unlogged.
+        """
+        thread = cls._background_check
+        if thread is None or not thread.is_alive():
+            return
+        thread.join(cls.EXIT_WAIT)
+        if thread.is_alive():
+            logger.debug("Config update check still running at exit; abandoning it")
+            utils._remote_tmp_path(cls._background_path).unlink(missing_ok=True)
+
+    @classmethod
+    def wait_for_update_check(cls, timeout: float | None = None) -> None:
+        """Block until a running background update check has finished."""
+        thread = cls._background_check
+        if thread is not None:
+            thread.join(timeout)
 
     def _check_and_update_config(self):
         """Check for config updates and notify about new entries."""
-        result = utils.compare_remote_file(str(self.CONFIG_URL), self.path)
+        now = datetime.datetime.now()
+        result = utils.compare_remote_file(
+            self.CONFIG_URL,
+            self.path,
+            etag=self.log.etag,
+            last_modified=self.log.last_modified,
+        )
 
         if result["error"]:
             logger.warning(f"Could not check for config updates: {result['error']}")
             return
 
         if result["has_updates"]:
-            # Load old and new configs to compare entries
-            old_config = utils.NestedTomlDict(self.path)
-            new_config = utils.NestedTomlDict(result["remote_tmp_path"])
+            # Parsing the download is what validates it, so it happens before
+            # the local file is replaced; the old one is usually cached already.
+            try:
+                new_config = utils.NestedTomlDict(
+                    result["remote_tmp_path"], read_only=True
+                )
+            except tomllib.TOMLDecodeError as e:
+                logger.warning(f"Ignoring invalid config from {self.CONFIG_URL}: {e}")
+                result["remote_tmp_path"].unlink(missing_ok=True)
+                self.log.log_check_time(now)
+                return
+            old_config = utils.NestedTomlDict(self.path, read_only=True)
 
             # Find new entries by comparing the flattened key sets
             old_keys = self._get_all_keys(old_config.to_dict())
@@ -72,14 +205,17 @@ class ConfigHandler(utils.NestedTomlDict):
             # Replace the local config with the updated one
             result["remote_tmp_path"].replace(self.path)
             logger.info(f"Updated static config from {self.CONFIG_URL}")
-            self.log.log_update_time()
+            # Only now that the file matches them, or a 304 would pin a stale copy
+            self.log.log_validators(result.get("etag"), result.get("last_modified"))
+            self.log.log_update_time(now)
 
             # Clean up temp file if it still exists
             if result["remote_tmp_path"].exists():
                 result["remote_tmp_path"].unlink()
         else:
             logger.debug("Static config is up to date")
-            self.log.log_check_time()
+            self.log.log_validators(result.get("etag"), result.get("last_modified"))
+            self.log.log_check_time(now)
 
     def _get_all_keys(self, d, parent_key=""):
         """Recursively get all dotted keys from a nested dictionary."""
@@ -94,15 +230,53 @@ class ConfigHandler(utils.NestedTomlDict):
 
     @property
     def should_update(self) -> bool:
-        """Check if the config file should be updated (if older than one day)."""
-        last_update = self.log.last_update
-        if last_update is None:
+        """Check if the config file should be updated (if not checked for about a day).
+
+        Counts from the last download or the last check that found nothing
+        new, whichever is later. The day is stretched or shortened by up to
+        ``UPDATE_JITTER`` at random, so that installs set up together don't
+        all poll GitHub at the same time.
+        """
+        last_activity = self.log.last_activity
+        if last_activity is None:
             return True
-        time_since = datetime.datetime.now() - last_update
-        return time_since > datetime.timedelta(days=1)
+        time_since = datetime.datetime.now() - last_activity
+        jitter = self.UPDATE_JITTER * random.uniform(-1, 1)
+        return time_since > self.UPDATE_INTERVAL + jitter
+
+    @cached_property
+    def urls(self) -> Mapping[str, str]:
+        """Flat mapping of every dotted index key to its URL.
+
+        Built once from the parsed config, so ``get_url`` is a single dict
+        lookup instead of a walk through the nested tables. Handlers are
+        created per index, so the mapping is shared between all of them
+        while they read the same parse of an unchanged file; it is handed
+        out as a read-only view so no caller can change it for the others.
+        """
+        cached = ConfigHandler._urls_cache
+        if cached is not None and cached[0] is self.doc:
+            return cached[1]
+        urls = {}
+
+        def _flatten(d, parent_key=""):
+            for k, v in d.items():
+                key = f"{parent_key}.{k}" if parent_key else k
+                if isinstance(v, dict):
+                    _flatten(v, key)
+                else:
+                    urls[key] = str(v)
+
+        _flatten(self.doc)
+        # Holding on to the doc keeps the identity check above sound
+        view = MappingProxyType(urls)
+        ConfigHandler._urls_cache = (self.doc, view)
+        return view
 
     def get_url(self, key) -> URL:
-        return URL(str(self.get(key)))
+        # Memoized on the URL string itself, so a changed config needs no
+        # invalidation and every handler shares the parsed objects.
+        return _parse_url(str(self.urls.get(key)))
 
     def _delete(self):
         """Delete the local configuration file."""
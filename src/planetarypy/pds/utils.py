@@ -17,6 +17,8 @@ __all__ = [
     "pid_column",
 ]
 
+from collections.abc import Callable
+from pathlib import PurePosixPath
 from typing import TYPE_CHECKING
 
 from .static_index import ConfigHandler
@@ -38,21 +40,9 @@ def _all_dotted_index_keys() -> list[str]:
     list[str]
         Sorted list of all available dotted index keys.
     """
-    # Static: flatten nested config to dotted keys
-    config = ConfigHandler()
-    config_doc = config.to_dict()
-
-    static_keys: set[str] = set()
-
-    def _collect_keys(d: dict, parent: str = ""):
-        for k, v in d.items():
-            new_parent = f"{parent}.{k}" if parent else k
-            if isinstance(v, dict):
-                _collect_keys(v, new_parent)
-            else:
-                static_keys.add(new_parent)
-
-    _collect_keys(config_doc)
+    # Static: the handler's flat URL mapping is keyed by the dotted keys,
+    # and is shared while the config file is unchanged
+    static_keys = set(ConfigHandler().urls)
 
     # Dynamic keys are already dotted
     dynamic_keys = set(DYNAMIC_URL_HANDLERS.keys())
@@ -148,7 +138,7 @@ def validate_index_key(index_key: str) -> str:
 def get_mission_names() -> list[str]:
     """Return a sorted list of all available missions (from static and dynamic configs)."""
     keys = _all_dotted_index_keys()
-    missions = {k.split(".")[0] for k in keys if k}
+    missions = {k.split(".", 1)[0] for k in keys if k}
     return sorted(missions)
 
 
@@ -160,7 +150,7 @@ def get_instrument_names(mission: str) -> list[str]:
     keys = _all_dotted_index_keys()
     instruments = set()
     for k in keys:
-        parts = k.split(".")
+        parts = k.split(".", 2)
         if len(parts) >= 2 and parts[0] == mission:
             instruments.add(parts[1])
     return sorted(instruments)
@@ -175,9 +165,9 @@ def get_index_names(mission_instrument: str) -> list[str]:
     keys = _all_dotted_index_keys()
     indexes = set()
     for k in keys:
-        parts = k.split(".")
-        if len(parts) >= 3 and parts[0] == mission and parts[1] == instrument:
-            indexes.add(".".join(parts[2:]))
+        parts = k.split(".", 2)
+        if len(parts) == 3 and parts[0] == mission and parts[1] == instrument:
+            indexes.add(parts[2])
     return sorted(indexes)
 
 
@@ -218,7 +208,7 @@ def print_available_indexes(
         if filter_mission and not key.startswith(filter_mission + "."):
             return False
         if filter_instrument:
-            parts = key.split(".")
+            parts = key.split(".", 2)
             if len(parts) < 2:
                 return False
             if not (parts[0] == filter_mission and parts[1] == filter_instrument):
@@ -361,12 +351,20 @@ def _normalize_pid(value: str, index_key: str | None = None) -> str:
     no-op, so the same function can normalize both stored values and
     user input before comparison.
     """
-    bare = _bare_pid(value)
-    if index_key is not None:
-        cfg = _index_config_for(index_key)
-        if cfg is not None and cfg.pid_strip_prefix_re:
-            bare = _re.sub(cfg.pid_strip_prefix_re, "", bare)
-    return bare
+    return _pid_normalizer(index_key)(value)
+
+
+def _pid_normalizer(index_key: str | None) -> Callable[[str], str]:
+    """Return :func:`_normalize_pid` for one index, as a one-argument function.
+
+    For mapping over an index column: the catalog registry is searched and
+    the prefix pattern compiled once, not once per row.
+    """
+    cfg = _index_config_for(index_key) if index_key is not None else None
+    if cfg is None or not cfg.pid_strip_prefix_re:
+        return _bare_pid
+    prefix = _re.compile(cfg.pid_strip_prefix_re)
+    return lambda value: prefix.sub("", _bare_pid(value))
 
 
 def _bare_pid(value: str) -> str:
@@ -382,8 +380,6 @@ def _bare_pid(value: str) -> str:
        PRODUCT_IDs of the form ``FHA/00435`` where ``/`` is a separator,
        not a path).
     """
-    from pathlib import PurePosixPath
-
     name = PurePosixPath(value).name or value
     if _PDS_EXT_RE.search(name):
         return _PDS_EXT_RE.sub("", name)
@@ -561,7 +557,7 @@ def rebuild_pid_cache(index_key: str):
         .str.strip()
     )
     series = series[series != ""]
-    bare = series.map(lambda v: _normalize_pid(v, index_key)).str.upper()
+    bare = series.map(_pid_normalizer(index_key)).str.upper()
     bare = bare[bare != ""].drop_duplicates().sort_values()
     cache.write_text("\n".join(bare) + "\n")
     return cache
@@ -740,7 +736,7 @@ def get_meta(instr_key: str, product_id: str, long: bool = False):
             has_index_prefix = bool(cfg and cfg.pid_strip_prefix_re)
             if input_is_decorated or column_is_decorated or has_index_prefix:
                 mask = (
-                    series.apply(lambda v: _normalize_pid(v, instr_key))
+                    series.apply(_pid_normalizer(instr_key))
                     .str.upper() == pid_norm_upper
                 )
         if mask.any():
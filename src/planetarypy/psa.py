@@ -17,8 +17,6 @@ import zipfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
-import requests
-
 if TYPE_CHECKING:
     import pandas as pd
 
@@ -43,9 +41,12 @@ PSA_TAP_SYNC = "https://psa.esa.int/psa-tap/tap/sync"
 
 def query(adql: str, *, timeout: int = 60) -> list[dict]:
     """Run an ADQL query against the PSA TAP service; return rows as dicts."""
-    resp = requests.get(
+    from planetarypy.utils import headers, http_session
+
+    resp = http_session().get(
         PSA_TAP_SYNC,
         params={"REQUEST": "doQuery", "LANG": "ADQL", "FORMAT": "json", "QUERY": adql},
+        headers=headers(),
         timeout=timeout,
     )
     resp.raise_for_status()
@@ -335,11 +336,13 @@ def _fetch_direct(
     label_url: str, dataset_id: str, root: Path, marker: Path
 ) -> list[Path]:
     """Fetch a product's files directly from the PSA FTP archive (no zip)."""
-    from planetarypy.utils import url_retrieve
+    # Shared session: the label GET and the downloads after it reuse the
+    # same connection to the archive host.
+    from planetarypy.utils import headers, http_session, url_retrieve
 
     jobs = [(label_url, _ftp_relpath(label_url, dataset_id))]
     if label_url.upper().endswith(".LBL"):
-        label_text = requests.get(label_url, timeout=60).text
+        label_text = http_session().get(label_url, headers=headers(), timeout=60).text
         base_url = label_url.rsplit("/", 1)[0]
         for fname in _label_data_pointers(label_text):
             data_url = f"{base_url}/{fname}"
@@ -478,7 +481,7 @@ def _member_geometry_df(dataset: str, cache_dir: Path, *, force: bool):
     import pandas as pd
 
     from planetarypy.pds.index_labels import IndexLabel
-    from planetarypy.utils import url_retrieve
+    from planetarypy.utils import headers, http_session, url_retrieve
 
     ds = _normalise_dataset(dataset)
     safe = ds.replace("/", "-")   # a "/" in the DATA_SET_ID must not split the cache path
@@ -489,7 +492,7 @@ def _member_geometry_df(dataset: str, cache_dir: Path, *, force: bool):
     index_url = _index_dir_url(ds)
     if index_url is None:
         return None
-    listing = requests.get(index_url, timeout=60).text
+    listing = http_session().get(index_url, headers=headers(), timeout=60).text
     geo = _GEO_LBL_RE.findall(listing)
     lbl_name = geo[0] if geo else "INDEX.LBL"
     tab_name = lbl_name.rsplit(".", 1)[0] + ".TAB"
@@ -67,6 +67,10 @@ def _as_iso(value: "Union[str, _dt.datetime]") -> str:
 
     if isinstance(value, dt.datetime):
         return value.isoformat()
+    try:
+        return dt.datetime.fromisoformat(value).isoformat()
+    except ValueError:
+        pass
     from dateutil import parser as _dtparser
 
     return _dtparser.parse(value).isoformat()
@@ -18,3 +18,10 @@ __all__ = (
     # From generic_kernels
     generic_kernels.__all__
 )
+
+
+def __getattr__(name: str):
+    """Forward the lazily loaded ``datasets`` table from ``archived_kernels``."""
+    if name == "datasets":
+        return archived_kernels.datasets
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,8 +11,9 @@ with a Subsetter class, that only requires the mission identifier, start and
 stop as parameters.
 """
 
+# ``datasets`` is public too, but served lazily by ``__getattr__`` below;
+# listing it here would make ``from .archived_kernels import *`` fetch it.
 __all__ = [
-    "datasets",
     "download_one_url",
     "Subsetter",
     "get_metakernel_and_files",
@@ -21,9 +22,11 @@ __all__ = [
 ]
 
 import re
+import time
 import zipfile
-from datetime import timedelta
-from io import BytesIO
+from datetime import datetime, timedelta
+from functools import cache
+from io import BytesIO, StringIO
 from itertools import repeat
 from multiprocessing import cpu_count
 from pathlib import Path
@@ -38,7 +41,7 @@ from yarl import URL
 
 from ..datetime_format_converters import fromdoyformat
 from ..pds.index_logging import AccessLog
-from ..utils import atomic_write
+from ..utils import atomic_write, headers, http_session
 from ..utils import url_retrieve
 from .config import BASE_URL, KERNEL_STORAGE, NAIF_URL
 
@@ -125,9 +128,9 @@ def _resolve_mission(mission_input: str) -> tuple[str, str | None]:
         if label.lower() == lower:
             return label, code
 
-    # If datasets already loaded, check index case-insensitively
+    # Check the datasets index case-insensitively
     try:
-        labels = [str(x) for x in datasets.index]
+        labels = [str(x) for x in _load_datasets().index]
     except Exception:
         labels = []
 
@@ -148,12 +151,63 @@ def _resolve_mission(mission_input: str) -> tuple[str, str | None]:
     return mission_input, None
 
 
+def _fetch_archive_page(log: AccessLog | None) -> requests.Response:
+    """GET the NAIF archive page, conditional on ``log``'s validators if given.
+
+    Returns the response, which is a ``304 Not Modified`` without a body when
+    the validators still match.
+    """
+    request_headers = headers()
+    if log is not None:
+        if log.etag:
+            request_headers["If-None-Match"] = log.etag
+        if log.last_modified:
+            request_headers["If-Modified-Since"] = log.last_modified
+    logger.info(f"Fetching SPICE datasets table from {ARCHIVE_URL}")
+    response = http_session().get(str(ARCHIVE_URL), headers=request_headers, timeout=60)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
+
+
+def _read_cached_datasets() -> pd.DataFrame | None:
+    """Read the cached datasets table, or None if it can't be read."""
+    try:
+        return pd.read_csv(DATASETS_CACHE, index_col=0)
+    # Unreadable file or unparsable csv (pandas' parser errors are ValueErrors)
+    except (OSError, ValueError) as e:
+        logger.warning(
+            f"Failed to read cached datasets at {DATASETS_CACHE}: {e}; refetching"
+        )
+        return None
+
+
+def _recently_written(path: Path) -> bool:
+    """Whether ``path`` was written less than a day ago.
+
+    The cache is only rewritten when NAIF served a changed page, so one
+    ``stat`` settles the common case of a recent download without reading
+    the access log; an older file still needs the log's last check.
+    """
+    try:
+        age = time.time() - path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return age < AccessLog.ONEDAY.total_seconds()
+
+
 def get_datasets():
     """Retrieve the NAIF archived datasets table with a once-per-day cache.
 
     Uses the shared PDS AccessLog mechanism to avoid refetching more than once
     per day. The parsed table is cached to a CSV under ~/.planetarypy_cache.
     """
+    if _recently_written(DATASETS_CACHE):
+        logger.info("Using recently downloaded SPICE datasets table")
+        df = _read_cached_datasets()
+        if df is not None:
+            return df
+
     # Use the same central log file mechanism as PDS indices (no new log file)
     log = AccessLog("spice.archived_kernels.datasets")
     logger.debug(f"Datasets cache path: {DATASETS_CACHE}")
@@ -164,21 +218,27 @@ def get_datasets():
     )
     # If we've checked within the last day and a cache exists, load and return it
     if DATASETS_CACHE.is_file() and not log.should_check:
-        try:
-            logger.info("Using cached SPICE datasets table")
-            return pd.read_csv(DATASETS_CACHE, index_col=0)
-        except Exception as e:
-            # If cache is unreadable, fall through to refresh
-            logger.warning(
-                f"Failed to read cached datasets at {DATASETS_CACHE}: {e}; refetching"
-            )
+        logger.info("Using cached SPICE datasets table")
+        df = _read_cached_datasets()
+        if df is not None:
+            return df
 
     # Ensure parent exists before writing cache later
     DATASETS_CACHE.parent.mkdir(parents=True, exist_ok=True)
 
-    # Fetch and parse from the remote page
-    logger.info(f"Fetching SPICE datasets table from {ARCHIVE_URL}")
-    res = pd.read_html(str(ARCHIVE_URL), extract_links="all", header=0)[
+    # With a cache to fall back on, ask NAIF only for a changed page
+    response = _fetch_archive_page(log if DATASETS_CACHE.is_file() else None)
+    if response.status_code == 304:
+        df = _read_cached_datasets()
+        if df is None:
+            response = _fetch_archive_page(None)
+        else:
+            logger.info("SPICE datasets page unchanged, using cached table")
+            log.log_check_time()
+            return df
+
+    # Parse the remote page
+    res = pd.read_html(StringIO(response.text), extract_links="all", header=0)[
         6
     ]  # table is at index 6
 
@@ -234,17 +294,31 @@ def get_datasets():
             df.to_csv(tmp)
         logger.debug(f"Wrote datasets cache to {DATASETS_CACHE}")
     finally:
-        # Record both last update and last check
-        log.log_update_time()
-        log.log_check_time()
+        # Record both last update and last check, in one write
+        with log.batch():
+            log.log_validators(
+                response.headers.get("ETag"), response.headers.get("Last-Modified")
+            )
+            now = datetime.now()
+            log.log_update_time(now)
+            log.log_check_time(now)
         logger.debug("Updated datasets access log timestamps")
     return df
 
 
-datasets = get_datasets()
-datasets = datasets.merge(
-    shorthands.to_frame().reset_index(), on="Mission Name"
-).set_index("shorthand")
+@cache
+def _load_datasets() -> pd.DataFrame:
+    """Datasets table indexed by mission shorthand, fetched on first use."""
+    return get_datasets().merge(
+        shorthands.to_frame().reset_index(), on="Mission Name"
+    ).set_index("shorthand")
+
+
+def __getattr__(name: str):
+    """Serve ``datasets`` lazily, so importing this module stays offline."""
+    if name == "datasets":
+        return _load_datasets()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 ## Validation helpers
@@ -259,7 +333,7 @@ def _is_start_valid(mission: str, start: Time) -> bool:
     start : astropy.Time
         Start time in astropy.Time format.
     """
-    return Time(datasets.at[mission, "Start Time"]) <= start
+    return Time(_load_datasets().at[mission, "Start Time"]) <= start
 
 
 def _is_stop_valid(mission: str, stop: Time) -> bool:
@@ -273,7 +347,7 @@ def _is_stop_valid(mission: str, stop: Time) -> bool:
     stop : astropy.Time
         Stop time in astropy.Time format.
     """
-    return Time(datasets.at[mission, "Stop Time"]) >= stop
+    return Time(_load_datasets().at[mission, "Stop Time"]) >= stop
 
 
 def download_one_url(url, local_path, overwrite: bool = False):
@@ -367,7 +441,9 @@ class Subsetter:
 
         It uses the property `payload` to create the required request's parameters.
         """
-        return requests.get(BASE_URL, params=self.payload, stream=True)
+        return http_session().get(
+            BASE_URL, params=self.payload, headers=headers(), stream=True
+        )
 
     @property
     def start(self):
@@ -411,7 +487,7 @@ class Subsetter:
             )
         p = {
             "dataset": last_part(
-                URL(datasets.at[self.mission_code, "Archive Link"]), 2
+                URL(_load_datasets().at[self.mission_code, "Archive Link"]), 2
             ),
             "start": self.start.iso,
             "stop": self.stop.iso,
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-import requests
+from planetarypy.utils import http_session
 
 
 def download_file(url, local_path, overwrite=False):
@@ -17,7 +17,7 @@ def download_file(url, local_path, overwrite=False):
 
     # Download the file
     print(f"Downloading {url} to {local_path}")
-    with requests.get(url, stream=True) as r:
+    with http_session().get(url, stream=True) as r:
         r.raise_for_status()
         with open(local_path, "wb") as f:
             for chunk in r.iter_content(chunk_size=8192):
@@ -34,7 +34,6 @@ from collections import namedtuple
 from dataclasses import dataclass
 from math import tau
 
-import dateutil.parser as tparser
 import numpy as np
 
 from ._deps import SPICE_INSTALL_HINT, spice
@@ -81,6 +80,14 @@ def _parse_time(time) -> dt.datetime:
         return dt.datetime.now()
     if isinstance(time, dt.datetime):
         return time
+    # The stdlib parser handles the usual ISO strings much faster; dateutil
+    # stays for free-form input like "Jan 1 2020"
+    try:
+        return dt.datetime.fromisoformat(time)
+    except ValueError:
+        pass
+    import dateutil.parser as tparser
+
     return tparser.parse(time)
 
 
@@ -1,16 +1,22 @@
 """General utility functions for planetarypy."""
+import atexit
+import copy
 import datetime as dt
 import email.utils as eut
+import hashlib
 import http.client as httplib
+import json
 import os
+import re
+import tomllib
+from collections.abc import Iterator, Mapping
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-from urllib.request import Request, urlopen
+from typing import TYPE_CHECKING, Any
+from urllib.error import URLError
 
-import pandas as pd
 import requests
-import tomlkit
 from loguru import logger
 
 try:
@@ -20,6 +26,7 @@ except (KeyError, ImportError):
 else:
     ISIS_AVAILABLE = True
 
+from requests.adapters import HTTPAdapter, Retry
 from requests.auth import HTTPBasicAuth
 try:
     from tqdm.auto import tqdm
@@ -27,10 +34,14 @@ except ImportError:
     # Fallback: Just use the identity function if tqdm is not installed
     def tqdm(x, *args, **kwargs):
         return x
-from yarl import URL
-
 from planetarypy.datetime_format_converters import fromdoyformat
 
+if TYPE_CHECKING:
+    # Only for annotations: importing pandas here would make every
+    # ``from planetarypy.utils import url_retrieve`` pay for it.
+    import pandas as pd
+    from yarl import URL
+
 
 _PROJECT_URL = "https://github.com/planetarypy/planetarypy"
 _USER_AGENT: str | None = None
@@ -65,8 +76,34 @@ def headers() -> dict[str, str]:
     """Default request headers, carrying :func:`user_agent`."""
     return {"User-Agent": user_agent()}
 
+
+@lru_cache(maxsize=1)
+def http_session() -> requests.Session:
+    """Shared session for our HTTP calls, created on first use.
+
+    Keeping connections alive saves a TCP and TLS handshake on every repeat
+    request to the same host (the daily config check, index label and table
+    downloads), and transient gateway errors are retried with backoff.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        # Hand the last response back so callers keep checking status codes
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    atexit.register(session.close)
+    return session
+
+
 __all__ = [
     "user_agent",
+    "http_session",
     "replace_all_doy_times",
     "parse_http_date",
     "get_remote_timestamp",
@@ -79,12 +116,119 @@ __all__ = [
     "compare_remote_file",
     "calculate_hours_since_timestamp",
     "NestedTomlDict",
+    "toml_dumps",
+    "write_toml",
     "compare_remote_file",
     "parallel_map",
     "read_pids",
 ]
 
 
+@lru_cache(maxsize=256)
+def _split_key(dotted_key: str) -> tuple[str, ...]:
+    """Split a dotted key; the same few index keys are looked up over and over."""
+    return tuple(dotted_key.split("."))
+
+
+# path -> ((st_mtime_ns, st_size), parsed document) for read-only loads
+_READ_ONLY_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def _load_toml_read_only(path: Path) -> dict:
+    """Parse a TOML file with tomllib, reusing the last parse if it is unchanged.
+
+    The result is shared between callers and must not be modified.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _READ_ONLY_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with path.open("rb") as f:
+        doc = tomllib.load(f)
+    _READ_ONLY_CACHE[path] = (stamp, doc)
+    return doc
+
+
+def _forget_read_only(path) -> None:
+    """Drop the cached parse of a file this process just wrote.
+
+    mtime can be too coarse to tell two quick writes apart; ours we know.
+    """
+    _READ_ONLY_CACHE.pop(Path(path), None)
+
+
+_BARE_KEY = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def _toml_string(text: str) -> str:
+    # A JSON string literal is a TOML basic string, as long as non-ASCII text
+    # stays literal (TOML rejects the surrogate pairs json uses for astral
+    # characters) and DEL, the one control character json leaves raw, is escaped
+    return json.dumps(text, ensure_ascii=False).replace("\x7f", "\\u007f")
+
+
+def _toml_key(key: str) -> str:
+    return key if _BARE_KEY.fullmatch(key) else _toml_string(key)
+
+
+def _toml_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, str):
+        return _toml_string(value)
+    if isinstance(value, (dt.datetime, dt.date, dt.time)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_toml_value(v) for v in value) + "]"
+    raise TypeError(f"Cannot write {type(value).__name__} to TOML: {value!r}")
+
+
+def _toml_tables(data: Mapping) -> Iterator[str]:
+    """Yield the TOML text of ``data`` one table at a time."""
+
+    def _emit(table: Mapping, path: tuple[str, ...]) -> Iterator[str]:
+        values = [(k, v) for k, v in table.items() if not isinstance(v, Mapping)]
+        lines = [f"{_toml_key(k)} = {_toml_value(v)}\n" for k, v in values]
+        if path and (values or not table):
+            lines.insert(0, "[" + ".".join(_toml_key(k) for k in path) + "]\n")
+        if lines:
+            yield "".join(lines)
+        for k, v in table.items():
+            if isinstance(v, Mapping):
+                yield from _emit(v, (*path, k))
+
+    # Only the root table can come first without a header, so every
+    # later chunk is a table that gets a blank line before it
+    for i, chunk in enumerate(_emit(data, ())):
+        yield "\n" + chunk if i else chunk
+
+
+def toml_dumps(data: Mapping) -> str:
+    """Write nested plain dicts as TOML, without tomlkit's document model.
+
+    For machine-written files like the access log, where there is no
+    formatting or comments to keep. Covers the types ``tomllib`` returns
+    (except arrays of tables), and like tomlkit's super tables, only tables
+    that hold values get a ``[header]``.
+    """
+    return "".join(_toml_tables(data))
+
+
+def write_toml(path: Path, data: Mapping) -> None:
+    """Atomically replace ``path`` with ``data`` written by :func:`toml_dumps`.
+
+    Tables are written as they are formatted, so the whole file never has
+    to sit in memory as one string.
+    """
+    with atomic_write(path, overwrite=True) as tmp:
+        with tmp.open("w", encoding="utf-8") as f:
+            f.writelines(_toml_tables(data))
+    _forget_read_only(path)
+
+
 class NestedTomlDict:
     """A wrapper around tomlkit documents that supports dotted key access.
 
@@ -97,18 +241,37 @@ class NestedTomlDict:
         >>> # Creates: [config.indexes.static]
         >>> #           last_updated = "2025-10-20"
         >>> doc.save()
+
+    Several updates can share one write with :meth:`batch`.
     """
 
-    def __init__(self, file_path: Path):
+    _batch_depth = 0
+    _dirty = False
+
+    def __init__(self, file_path: Path, read_only: bool = False):
         """Initialize with a file path, loading existing content if available.
 
         Args:
             file_path: Path to the TOML file
+            read_only: Parse with the stdlib ``tomllib`` into plain dicts.
+                Much faster than tomlkit, but formatting and comments are not
+                kept, so use it only for files this instance never saves. The
+                parse is reused while the file's mtime and size are unchanged,
+                and shared between instances, so don't ``set`` on these.
         """
         self.file_path = file_path
+        if read_only:
+            try:
+                self.doc = _load_toml_read_only(Path(self.file_path))
+            except FileNotFoundError:
+                self.doc = {}
+            return
+        import tomlkit
+
         try:
-            with self.file_path.open("r", encoding="utf-8") as f:
-                self.doc = tomlkit.load(f)
+            # tomlkit decodes UTF-8 bytes itself; skips the text-mode
+            # reader's chunked decoding and newline translation
+            self.doc = tomlkit.loads(Path(self.file_path).read_bytes())
         except FileNotFoundError:
             self.doc = tomlkit.document()
 
@@ -120,14 +283,24 @@ class NestedTomlDict:
             field: The field name to set in the final nested table
             value: The value to set
         """
-        keys = dotted_key.split(".")
+        keys = _split_key(dotted_key)
         current = self.doc
 
-        # Navigate/create nested structure
-        for k in keys:
-            if k not in current:
-                current[k] = tomlkit.table()
-            current = current[k]
+        # Navigate/create nested structure. Intermediate levels are super
+        # tables, so only [config.indexes.static] gets a header, not the
+        # empty [config] and [config.indexes] above it.
+        # One lookup per level; a new table is used directly, not re-fetched.
+        # A plain-dict doc (see AccessLog) gets plain dicts.
+        plain = type(current) is dict
+        if not plain:
+            import tomlkit
+        last = len(keys) - 1
+        for i, k in enumerate(keys):
+            child = current.get(k)
+            if child is None:
+                child = {} if plain else tomlkit.table(is_super_table=i < last)
+                current[k] = child
+            current = child
 
         # Set the value on the innermost table
         current[field] = value
@@ -143,14 +316,14 @@ class NestedTomlDict:
         Returns:
             The value at the specified path, or None if not found
         """
-        keys = dotted_key.split(".")
+        keys = _split_key(dotted_key)
         current = self.doc
 
         # Navigate the nested structure
         for k in keys:
-            if k not in current:
+            current = current.get(k)
+            if current is None:
                 return None
-            current = current[k]
 
         # Return the field value or the entire table
         if field is not None:
@@ -159,39 +332,95 @@ class NestedTomlDict:
 
     def to_dict(self) -> dict:
         """Convert to a regular Python dict."""
+        if type(self.doc) is dict:
+            # A read-only parse is shared; give the caller its own copy
+            return copy.deepcopy(self.doc)
         return dict(self.doc)
 
     def dumps(self) -> str:
         """Dump to TOML string."""
+        if type(self.doc) is dict:
+            # Plain dicts have no formatting to keep
+            return toml_dumps(self.doc)
+        import tomlkit
+
         return tomlkit.dumps(self.doc)
 
+    @contextmanager
+    def batch(self):
+        """Defer ``save`` calls inside the block to a single write on exit.
+
+        Nested blocks are fine; only the outermost one writes, and only if
+        something inside it asked to save.
+
+        Example:
+            >>> with doc.batch():
+            ...     doc.set("a.b", "x", 1)
+            ...     doc.save()  # deferred
+            ...     doc.set("a.b", "y", 2)
+            ...     doc.save()  # deferred
+            >>> # file written once here
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._dirty = False
+                self._write()
+
     def save(self) -> None:
-        """Save to the TOML file."""
-        with self.file_path.open("w", encoding="utf-8") as f:
-            tomlkit.dump(self.doc, f)
+        """Save to the TOML file, or mark dirty while inside :meth:`batch`."""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self._write()
+
+    def _write(self) -> None:
+        import tomlkit
 
+        with atomic_write(self.file_path, overwrite=True) as tmp:
+            with tmp.open("w", encoding="utf-8") as f:
+                tomlkit.dump(self.doc, f)
+        _forget_read_only(self.file_path)
 
-def is_older_than_hours(timestamp: dt.datetime, hours: float) -> bool:
+
+def is_older_than_hours(
+    timestamp: dt.datetime, hours: float, now: dt.datetime | None = None
+) -> bool:
     """
     Return True if the timestamp is older than the given number of hours.
+
+    See `calculate_hours_since_timestamp` for ``now``.
     """
-    return calculate_hours_since_timestamp(timestamp) > hours
+    return _age(timestamp, now) > dt.timedelta(hours=hours)
 
 
-def calculate_hours_since_timestamp(timestamp: dt.datetime) -> float:
+def calculate_hours_since_timestamp(
+    timestamp: dt.datetime, now: dt.datetime | None = None
+) -> float:
     """
     Calculate the number of hours since the given timestamp.
+
+    A naive timestamp is taken as local wall-clock time, like the ones in the
+    index access log; an aware one is compared against the current UTC time.
+    When checking many timestamps in one go, pass the same ``now`` (naive or
+    aware to match the timestamps) instead of reading the clock each time.
     """
-    now = dt.datetime.now()
-    if timestamp.tzinfo is None:
-        timestamp = timestamp.replace(tzinfo=dt.timezone.utc)
-    if now.tzinfo is None:
-        now = now.replace(tzinfo=dt.timezone.utc)
-    time_diff = now - timestamp
-    return time_diff.total_seconds() / 3600
+    return _age(timestamp, now).total_seconds() / 3600
+
 
+def _age(timestamp: dt.datetime, now: dt.datetime | None) -> dt.timedelta:
+    if now is None:
+        if timestamp.tzinfo is None:
+            now = dt.datetime.now()
+        else:
+            now = dt.datetime.now(dt.timezone.utc)
+    return now - timestamp
 
-def replace_all_doy_times(df: pd.DataFrame, timecol: str = "TIME") -> pd.DataFrame:
+
+def replace_all_doy_times(df: "pd.DataFrame", timecol: str = "TIME") -> "pd.DataFrame":
     """
     Convert all detected DOY time columns in df to datetimes in place.
 
@@ -213,68 +442,132 @@ def get_remote_timestamp(url: str) -> dt.datetime:
     """
     Return the timestamp (last-modified) of a remote file at a URL.
 
-    Useful for checking if there's an updated file available.
+    Useful for checking if there's an updated file available. Asks with a
+    ``HEAD`` request, so no part of the file itself is transferred; servers
+    that refuse ``HEAD`` are asked with a ``GET`` instead.
+
+    Raises
+    ------
+    URLError
+        If the server can't be reached, answers with an error, or sends no
+        ``Last-Modified`` header.
     """
-    request = Request(str(url), headers=headers())
-    with urlopen(request, timeout=10) as conn:
-        t = parse_http_date(conn.headers["last-modified"])
-    return t
+    url = str(url)
+    try:
+        response = http_session().head(
+            url, headers=headers(), timeout=10, allow_redirects=True
+        )
+        if response.status_code in (405, 501):
+            response.close()
+            response = http_session().get(
+                url, headers=headers(), timeout=10, stream=True
+            )
+            response.close()  # only the headers are needed
+        response.raise_for_status()
+    except requests.RequestException as e:
+        raise URLError(e) from e
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified is None:
+        raise URLError(f"No Last-Modified header for {url}")
+    return parse_http_date(last_modified)
 
 
 def check_url_exists(url: str) -> bool:
     """Check if a URL exists."""
-    response = requests.head(url, headers=headers())
+    response = http_session().head(url, headers=headers())
     return response.status_code < 400
 
 
+def _remote_tmp_path(local_path: Path) -> Path:
+    """Where :func:`compare_remote_file` keeps the download for ``local_path``."""
+    return local_path.with_suffix(f".remote_tmp{local_path.suffix}")
+
+
 def compare_remote_file(
-    remote_url: str, local_path: Path, timeout: int = 30
+    remote_url: str,
+    local_path: Path,
+    timeout: int = 30,
+    etag: str | None = None,
+    last_modified: str | None = None,
 ) -> dict:
     """
     Compare content from a remote URL with a local file, keeping a temp copy of remote.
 
+    If validators from a previous response are given, the request is made
+    conditional on them, and an unchanged remote answers ``304 Not Modified``
+    without sending the body.
+
     Args:
         remote_url: URL to fetch remote content from
         local_path: Path to local file to compare against
         timeout: Timeout in seconds for the HTTP request
+        etag: ``ETag`` of the last response, sent as ``If-None-Match``
+        last_modified: ``Last-Modified`` of the last response, sent as
+            ``If-Modified-Since``
 
     Returns:
         dict: Contains 'has_updates' (bool), 'remote_tmp_path' (Path or None),
-            and 'error' (str or None)
+            'error' (str or None), and the response's 'etag' and
+            'last_modified' validators (str or None) to pass in next time
     """
+    request_headers = headers()
+    if etag:
+        request_headers["If-None-Match"] = etag
+    if last_modified:
+        request_headers["If-Modified-Since"] = last_modified
+    remote_tmp_path = _remote_tmp_path(local_path)
     try:
-        response = requests.get(remote_url, timeout=timeout)
-        response.raise_for_status()
-
-        remote_content = response.text
+        with http_session().get(
+            remote_url, headers=request_headers, timeout=timeout, stream=True
+        ) as response:
+            if response.status_code == 304:
+                return {
+                    "has_updates": False,
+                    "remote_tmp_path": None,
+                    "error": None,
+                    "etag": response.headers.get("ETag", etag),
+                    "last_modified": response.headers.get("Last-Modified", last_modified),
+                }
+            response.raise_for_status()
+
+            # Hash while streaming to the temp file, so the body is handled once
+            remote_hash = hashlib.sha256()
+            remote_size = 0
+            with remote_tmp_path.open("wb") as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    remote_hash.update(chunk)
+                    remote_size += len(chunk)
+                    f.write(chunk)
 
-        # Read local content
         try:
-            local_content = local_path.read_text(encoding="utf-8")
+            local_size = local_path.stat().st_size
         except FileNotFoundError:
-            local_content = ""
-
-        has_updates = remote_content != local_content
-
-        # Save remote content to temp file if different
-        remote_tmp_path = None
-        if has_updates:
-            # Create temp file with similar name
-            remote_tmp_path = local_path.with_suffix(f".remote_tmp{local_path.suffix}")
-            remote_tmp_path.write_text(remote_content, encoding="utf-8")
+            local_size = None
+        if local_size != remote_size:
+            # A different length settles it without reading the local file
+            has_updates = True
+        else:
+            with local_path.open("rb") as f:
+                local_digest = hashlib.file_digest(f, "sha256").digest()
+            has_updates = remote_hash.digest() != local_digest
+        if not has_updates:
+            remote_tmp_path.unlink()
 
         return {
             "has_updates": has_updates,
-            "remote_tmp_path": remote_tmp_path,
+            "remote_tmp_path": remote_tmp_path if has_updates else None,
             "error": None,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
         }
 
     except (requests.RequestException, requests.Timeout) as e:
+        remote_tmp_path.unlink(missing_ok=True)
         return {"has_updates": False, "remote_tmp_path": None, "error": str(e)}
 
 
 @contextmanager
-def atomic_write(path):
+def atomic_write(path, overwrite: bool = False):
     """Context manager yielding a per-PID scratch path; on clean exit,
     atomically moves it to ``path``.
 
@@ -289,6 +582,11 @@ def atomic_write(path):
     ``path`` already exists after completing their own scratch write
     and silently drop their copy rather than overwriting. On exception
     inside the ``with`` block the scratch file is cleaned up.
+
+    With ``overwrite=True`` the scratch file replaces an existing ``path``
+    instead, for files that are rewritten in place (config and log files):
+    readers then see either the old or the new content, never a
+    half-written file.
     """
     path = Path(path)
     tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
@@ -299,7 +597,7 @@ def atomic_write(path):
         raise
     if not tmp.exists():
         return
-    if path.exists():
+    if path.exists() and not overwrite:
         tmp.unlink(missing_ok=True)
         return
     try:
@@ -310,7 +608,7 @@ def atomic_write(path):
 
 
 def url_retrieve(
-    url: str | URL,
+    url: "str | URL",
     outfile: str,
     chunk_size: int = 4096,
     user: str = None,
@@ -361,7 +659,7 @@ def url_retrieve(
         auth = HTTPBasicAuth(user, passwd)
     else:
         auth = None
-    R = requests.get(url, stream=True, allow_redirects=True, auth=auth, headers=headers())
+    R = http_session().get(url, stream=True, allow_redirects=True, auth=auth, headers=headers())
     if R.status_code != 200:
         raise ConnectionError(f"Could not download {url}\nError code: {R.status_code}")
     tqdm_kwargs = dict(
@@ -409,7 +707,8 @@ def have_internet() -> bool:
     try:
         conn.request("HEAD", "/")
         return True
-    except Exception:
+    # Socket errors and timeouts are OSErrors; anything else is a bug
+    except (OSError, httplib.HTTPException):
         return False
     finally:
         conn.close()
@@ -81,3 +81,14 @@ def _isolate_index_cache():
     clear_index_cache()
     yield
     clear_index_cache()
+
+
+@pytest.fixture(autouse=True)
+def _sync_config_check(monkeypatch):
+    """Run the daily index-URL config check in the foreground.
+
+    ``ConfigHandler`` normally checks in a background thread; in tests that
+    thread would outlive the test and write to whatever log path the next
+    test has patched in.
+    """
+    monkeypatch.setenv("PLANETARYPY_SYNC_CONFIG_CHECK", "1")
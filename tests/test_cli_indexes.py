@@ -663,6 +663,17 @@ class TestIndexesRefresh:
         assert "Malformed index key" in result.output
         assert "Traceback" not in result.output
 
+    def test_dynamic_checks_all_scraped_indexes(self):
+        with patch(
+            "planetarypy.pds.dynamic_index.check_for_updates",
+            return_value={"mro.ctx.edr": True, "lro.lroc.edr": False},
+        ) as check:
+            result = runner.invoke(app, ["indexes", "refresh", "--dynamic"])
+        assert result.exit_code == 0
+        check.assert_called_once_with(force=True)
+        assert "mro.ctx.edr: update available" in result.output
+        assert "lro.lroc.edr: up to date" in result.output
+
     def test_unknown_cache_key_no_traceback(self):
         # Used to die inside urllib as "unknown url type: 'None'".
         with patch("planetarypy.pds.utils._all_dotted_index_keys",
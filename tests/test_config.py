@@ -1,5 +1,9 @@
 """Tests for basic configuration module."""
 
+import datetime
+import json
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
@@ -22,6 +26,13 @@ def test_config_getitem():
 def test_config_missing_key():
     """Test that missing keys return empty string."""
     assert config.get_value("nonexistent.key") == ""
+    assert config.get_value("nonexistent") == ""
+
+
+def test_config_key_below_a_scalar_is_missing():
+    """Descending past a leaf value is a miss, not an error."""
+    assert config.get_value("storage_root.deeper") == ""
+    assert config["storage_root.deeper"] == ""
 
 
 def test_config_get_value():
@@ -144,3 +155,103 @@ def test_existing_explicit_false_is_preserved():
         # Backfill must use ``in`` not ``get()`` so falsy-but-present
         # values aren't overwritten.
         assert cfg.get_value("filter_deprecation_warnings") is False
+
+
+def test_fresh_config_is_written_once(monkeypatch):
+    """A new install writes the complete default file in one go; reading it
+    back must not trigger a second save just to fill in ``storage_root``."""
+    saves = []
+    monkeypatch.setattr(Config, "save", lambda self: saves.append(self.path))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fresh = Config(Path(tmpdir) / "fresh.toml")
+        assert saves == []
+        assert fresh.storage_root == Path.home() / "planetarypy_data"
+        assert fresh.get_value("storage_root") == str(fresh.storage_root)
+
+
+def test_fresh_config_with_a_non_ascii_storage_root(monkeypatch):
+    """An astral character in the home path must still give a valid file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir) / "j\U0001F600 Ørsted"
+        root.mkdir()
+        monkeypatch.setattr(Config, "_default_storage_root", staticmethod(lambda: root))
+        Config(Path(tmpdir) / "fresh.toml")
+        assert Config(Path(tmpdir) / "fresh.toml").storage_root == root
+
+
+def test_config_to_json_shows_plain_values():
+    """to_json shows the settings as JSON, including non-string TOML values."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfg = Config(Path(tmpdir) / "repr.toml")
+        cfg.set_value("checked", datetime.datetime(2025, 1, 1, 12, 0))
+        shown = json.loads(cfg.to_json())
+        assert json.loads(str(cfg)) == shown
+    assert shown["storage_root"] == str(cfg.storage_root)
+    assert shown["checked"] == "2025-01-01 12:00:00"
+
+
+def test_config_repr_is_concise():
+    """repr names the file and top-level keys instead of dumping everything."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfg = Config(Path(tmpdir) / "repr.toml")
+        shown = repr(cfg)
+    assert shown.startswith("<Config path=")
+    assert "'storage_root'" in shown
+    assert "planetarypy_data" not in shown
+
+
+def test_complete_config_is_read_without_tomlkit():
+    """Reading a complete config never builds the tomlkit document."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfg = Config(Path(tmpdir) / "fast.toml")
+        cfg = Config(cfg.path)
+        assert cfg.get_value("max_table_rows") == 3
+        assert "tomldoc" not in vars(cfg)
+
+
+def test_unsaved_edit_is_visible_to_reads():
+    """Values set with ``save=False`` are returned by later lookups."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfg = Config(Path(tmpdir) / "edit.toml")
+        cfg.set_value("max_table_rows", 7, save=False)
+        assert cfg.get_value("max_table_rows") == 7
+        assert Config(cfg.path).get_value("max_table_rows") == 3
+
+
+def test_module_config_is_one_shared_instance():
+    """The lazily built singleton is the same object on every access."""
+    import planetarypy.config as config_module
+
+    assert config_module.config is config
+    assert config_module.config is config_module.config
+
+
+def test_non_ascii_values_survive_a_save():
+    """Config files are UTF-8 on disk, independent of the locale."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cfg = Config(Path(tmpdir) / "utf8.toml")
+        cfg.set_value("note", "Ångström – ü")
+        assert "Ångström" in cfg.path.read_bytes().decode("utf-8")
+        assert Config(cfg.path).get_value("note") == "Ångström – ü"
+        assert not list(Path(tmpdir).glob("*.tmp"))
+
+
+def test_importing_the_catalog_does_not_read_the_config():
+    """The config file is only read once a setting is actually needed."""
+    code = (
+        "import planetarypy.config as c, planetarypy.catalog; "
+        "assert c._default_config.cache_info().currsize == 0"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_reading_config_does_not_import_tomlkit(tmp_path):
+    """tomlkit is only needed to write a config back, so reads skip its import."""
+    path = tmp_path / "lazy.toml"
+    Config(path)
+    code = (
+        "import sys; from planetarypy.config import Config; "
+        f"Config({str(path)!r}).get_value('storage_root'); "
+        "assert 'tomlkit' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -8,6 +8,7 @@ so these registry tests have no optional-dep guard.
 import pytest
 
 from planetarypy import datasets
+from planetarypy.utils import http_session
 
 
 def test_bodies_and_list():
@@ -87,8 +88,6 @@ def test_as_source():
 
 
 def test_stac_search_mocked(monkeypatch):
-    import requests
-
     captured = {}
 
     class FakeResp:
@@ -109,7 +108,7 @@ def test_stac_search_mocked(monkeypatch):
         captured["params"] = params
         return FakeResp()
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_session(), "get", fake_get)
     items = datasets.mars.themis_mosaics.at(10.0, -20.0)
     assert captured["url"].endswith("/search")
     assert captured["params"]["collections"] == "mo_themis_controlled_mosaics"
@@ -121,8 +120,6 @@ def test_stac_search_mocked(monkeypatch):
 
 
 def test_stac_items_unpack_mocked(monkeypatch):
-    import requests
-
     captured = {}
 
     class FakeResp:
@@ -141,7 +138,7 @@ def test_stac_items_unpack_mocked(monkeypatch):
         captured["params"] = params
         return FakeResp()
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_session(), "get", fake_get)
     items = datasets.mars.themis_mosaics.items(limit=5)
     assert captured["url"].endswith("/collections/mo_themis_controlled_mosaics/items")
     assert captured["params"]["limit"] == 5
@@ -150,8 +147,6 @@ def test_stac_items_unpack_mocked(monkeypatch):
 
 
 def test_stac_collections_discover_mocked(monkeypatch):
-    import requests
-
     captured = {}
 
     class FakeResp:
@@ -167,7 +162,7 @@ def test_stac_collections_discover_mocked(monkeypatch):
         captured["url"] = url
         return FakeResp()
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(http_session(), "get", fake_get)
     cols = datasets.stac_collections("https://stac.astrogeology.usgs.gov/api")
     assert captured["url"].endswith("/collections")
     assert [c["id"] for c in cols] == [
@@ -3,11 +3,18 @@
 Tests use monkeypatching to avoid network calls and tmp_path for log files.
 """
 
+import threading
+from urllib.error import URLError
+
 import pandas as pd
 import pytest
-from yarl import URL
 
-from planetarypy.pds.dynamic_index import DYNAMIC_URL_HANDLERS, DynamicRemoteHandler
+from planetarypy.pds.dynamic_index import (
+    DYNAMIC_URL_HANDLERS,
+    DynamicRemoteHandler,
+    check_for_updates,
+)
+from planetarypy.pds import dynamic_url_handlers
 from planetarypy.pds.dynamic_url_handlers import CTXIndex, LROCIndex, LAMPEDRIndex, LAMPRDRIndex
 from planetarypy.pds.index_logging import AccessLog
 
@@ -27,8 +34,8 @@ def _make_volumes_df(folders: list[str]) -> pd.DataFrame:
     """Build a DataFrame that mimics pd.read_html output from a PDS directory listing.
 
     Real PDS pages produce tables with multiple columns (Name, Last modified, Size, Description).
-    The source code uses ``.dropna(how='all', axis=1)`` and ``.iloc[..., :-1]`` which drops the
-    last column, so we need at least two columns for the fixture to survive that trimming.
+    The source code uses ``.dropna(how='all', axis=1)`` and keeps only the first (name)
+    column, so the extra column just has to survive the NaN-dropping.
     """
     return pd.DataFrame({
         "Name": folders,
@@ -36,6 +43,30 @@ def _make_volumes_df(folders: list[str]) -> pd.DataFrame:
     })
 
 
+def test_read_html_fetches_through_shared_session(monkeypatch):
+    """Listing pages go through ``http_session()``, not pandas' urllib open."""
+    from planetarypy.utils import http_session
+
+    class FakeResponse:
+        text = "<table><tr><th>Name</th></tr><tr><td>mrox_1232/</td></tr></table>"
+
+        def raise_for_status(self):
+            pass
+
+    captured = {}
+
+    def fake_get(url, **kwargs):
+        captured["url"] = url
+        captured["timeout"] = kwargs.get("timeout")
+        return FakeResponse()
+
+    monkeypatch.setattr(http_session(), "get", fake_get)
+    tables = dynamic_url_handlers._read_html(CTXIndex.url, flavor="lxml")
+    assert captured["url"] == CTXIndex.url
+    assert captured["timeout"] is not None
+    assert tables[0]["Name"].tolist() == ["mrox_1232/"]
+
+
 # ---------------------------------------------------------------------------
 # CTXIndex tests
 # ---------------------------------------------------------------------------
@@ -49,7 +80,7 @@ class TestCTXIndex:
     def _patch_read_html(self, monkeypatch, folders=None):
         folders = folders or self.FOLDERS
         df = _make_volumes_df(folders)
-        monkeypatch.setattr(pd, "read_html", lambda url: [df])
+        monkeypatch.setattr(dynamic_url_handlers, "_read_html", lambda url, **kwargs: [df])
         return df
 
     def test_volumes_table_caches(self, monkeypatch):
@@ -57,12 +88,12 @@ class TestCTXIndex:
         call_count = 0
         original_folders = self.FOLDERS
 
-        def counting_read_html(url):
+        def counting_read_html(url, **kwargs):
             nonlocal call_count
             call_count += 1
             return [_make_volumes_df(original_folders)]
 
-        monkeypatch.setattr(pd, "read_html", counting_read_html)
+        monkeypatch.setattr(dynamic_url_handlers, "_read_html", counting_read_html)
 
         idx = CTXIndex()
         _ = idx.volumes_table
@@ -73,12 +104,25 @@ class TestCTXIndex:
         """latest_release_folder returns second-to-last row."""
         self._patch_read_html(monkeypatch)
         idx = CTXIndex()
-        # After iloc[1:, :-1] the df starts at row index 1 (skipping row 0).
+        # After iloc[1:, :1] the df starts at row index 1 (skipping row 0).
         # iloc[-2, 0] on that slice is the second-to-last row of the trimmed df.
         # Rows after trim: ["mrox_1231/", "mrox_1232/", "Parent Directory"]
         # iloc[-2] => "mrox_1232/"
         assert idx.latest_release_folder == "mrox_1232/"
 
+    def test_volumes_table_keeps_only_name_column(self, monkeypatch):
+        """The listing is read with lxml and trimmed to the name column."""
+        seen = {}
+
+        def recording_read_html(url, **kwargs):
+            seen.update(kwargs)
+            return [_make_volumes_df(self.FOLDERS)]
+
+        monkeypatch.setattr(dynamic_url_handlers, "_read_html", recording_read_html)
+        idx = CTXIndex()
+        assert list(idx.volumes_table.columns) == ["Name"]
+        assert seen["flavor"] == "lxml"
+
     def test_latest_release_number(self, monkeypatch):
         self._patch_read_html(monkeypatch)
         idx = CTXIndex()
@@ -88,7 +132,7 @@ class TestCTXIndex:
         self._patch_read_html(monkeypatch)
         idx = CTXIndex()
         result = idx.latest_index_label_url
-        assert isinstance(result, URL)
+        assert isinstance(result, str)
         assert str(result).endswith("mrox_1232/index/cumindex.lbl")
         # Should use the primary URL as the base
         assert str(result).startswith(CTXIndex.url)
@@ -97,13 +141,13 @@ class TestCTXIndex:
         """If primary URL fails, backup should be tried."""
         calls = []
 
-        def failing_primary(url):
+        def failing_primary(url, **kwargs):
             calls.append(url)
             if url == CTXIndex.url:
                 raise ConnectionError("Primary down")
             return [_make_volumes_df(self.FOLDERS)]
 
-        monkeypatch.setattr(pd, "read_html", failing_primary)
+        monkeypatch.setattr(dynamic_url_handlers, "_read_html", failing_primary)
 
         idx = CTXIndex()
         _ = idx.volumes_table
@@ -112,10 +156,46 @@ class TestCTXIndex:
         assert calls[1] == CTXIndex.backup_url
         assert idx._successful_url == CTXIndex.backup_url
 
+    def test_backup_wins_when_primary_is_slow(self, monkeypatch):
+        """A hanging primary should not delay the backup by its full timeout."""
+        import threading
+
+        release_primary = threading.Event()
+
+        def slow_primary(url, **kwargs):
+            if url == CTXIndex.url:
+                release_primary.wait(timeout=5)
+            return [_make_volumes_df(self.FOLDERS)]
+
+        monkeypatch.setattr(dynamic_url_handlers, "_read_html", slow_primary)
+        monkeypatch.setattr(CTXIndex, "hedge_delay", 0.01)
+
+        idx = CTXIndex()
+        try:
+            assert idx.latest_release_folder == "mrox_1232/"
+            assert idx._successful_url == CTXIndex.backup_url
+        finally:
+            release_primary.set()
+
+    def test_fast_primary_sends_no_backup_request(self, monkeypatch):
+        calls = []
+
+        def recording_read_html(url, **kwargs):
+            calls.append(url)
+            return [_make_volumes_df(self.FOLDERS)]
+
+        monkeypatch.setattr(dynamic_url_handlers, "_read_html", recording_read_html)
+        idx = CTXIndex()
+        _ = idx.volumes_table
+        assert calls == [CTXIndex.url]
+        assert idx._successful_url == CTXIndex.url
+
     def test_both_urls_fail_raises(self, monkeypatch):
         """If both primary and backup fail, should raise."""
         monkeypatch.setattr(
-            pd, "read_html", lambda url: (_ for _ in ()).throw(ConnectionError("down"))
+            dynamic_url_handlers,
+            "_read_html",
+            lambda url, **kwargs: (_ for _ in ()).throw(ConnectionError("down")),
         )
         idx = CTXIndex()
         with pytest.raises(ConnectionError):
@@ -135,12 +215,12 @@ class TestLROCIndex:
     def _patch_read_html(self, monkeypatch, folders=None):
         folders = folders or self.FOLDERS
         df = _make_volumes_df(folders)
-        monkeypatch.setattr(pd, "read_html", lambda url: [df])
+        monkeypatch.setattr(dynamic_url_handlers, "_read_html", lambda url, **kwargs: [df])
 
     def test_latest_release_folder(self, monkeypatch):
         self._patch_read_html(monkeypatch)
         idx = LROCIndex()
-        # After iloc[1:-1, :-1]: rows = ["LROLRC_0048/", "LROLRC_0049/"]
+        # After iloc[1:-1, :1]: rows = ["LROLRC_0048/", "LROLRC_0049/"]
         # iloc[-1, 0] => "LROLRC_0049/"
         assert idx.latest_release_folder == "LROLRC_0049/"
 
@@ -153,7 +233,7 @@ class TestLROCIndex:
         self._patch_read_html(monkeypatch)
         idx = LROCIndex()
         result = idx.latest_index_label_url
-        assert isinstance(result, URL)
+        assert isinstance(result, str)
         assert str(result).endswith("LROLRC_0049/INDEX/CUMINDEX.LBL")
         assert str(result).startswith(LROCIndex.edr_url)
 
@@ -195,7 +275,7 @@ class TestLAMPEDRIndex:
     def _patch_read_html(self, monkeypatch, folders=None):
         folders = folders or self.FOLDERS
         tables = _make_lamp_tables(folders)
-        monkeypatch.setattr(pd, "read_html", lambda url: tables)
+        monkeypatch.setattr(dynamic_url_handlers, "_read_html", lambda url, **kwargs: tables)
 
     def test_volumes_table_filters_to_dirs_only(self, monkeypatch):
         self._patch_read_html(monkeypatch)
@@ -206,12 +286,12 @@ class TestLAMPEDRIndex:
     def test_volumes_table_caches(self, monkeypatch):
         call_count = 0
 
-        def counting_read_html(url):
+        def counting_read_html(url, **kwargs):
             nonlocal call_count
             call_count += 1
             return _make_lamp_tables(self.FOLDERS)
 
-        monkeypatch.setattr(pd, "read_html", counting_read_html)
+        monkeypatch.setattr(dynamic_url_handlers, "_read_html", counting_read_html)
         idx = LAMPEDRIndex()
         _ = idx.volumes_table
         _ = idx.volumes_table
@@ -231,7 +311,7 @@ class TestLAMPEDRIndex:
         self._patch_read_html(monkeypatch)
         idx = LAMPEDRIndex()
         result = idx.latest_index_label_url
-        assert isinstance(result, URL)
+        assert isinstance(result, str)
         assert str(result).endswith("LROLAM_0062/INDEX/CUMINDEX.LBL")
         assert str(result).startswith(LAMPEDRIndex.url)
 
@@ -244,7 +324,7 @@ class TestLAMPRDRIndex:
     def _patch_read_html(self, monkeypatch, folders=None):
         folders = folders or self.FOLDERS
         tables = _make_lamp_tables(folders)
-        monkeypatch.setattr(pd, "read_html", lambda url: tables)
+        monkeypatch.setattr(dynamic_url_handlers, "_read_html", lambda url, **kwargs: tables)
 
     def test_latest_release_folder(self, monkeypatch):
         self._patch_read_html(monkeypatch)
@@ -260,7 +340,7 @@ class TestLAMPRDRIndex:
         self._patch_read_html(monkeypatch)
         idx = LAMPRDRIndex()
         result = idx.latest_index_label_url
-        assert isinstance(result, URL)
+        assert isinstance(result, str)
         assert str(result).endswith("LROLAM_1062/INDEX/CUMINDEX.LBL")
         assert str(result).startswith(LAMPRDRIndex.url)
 
@@ -425,6 +505,20 @@ class TestDynamicRemoteHandler:
         assert handler.log.last_check is not None
 
 
+    def test_pending_update_only_advances_check_time(self, monkeypatch):
+        """Rediscovering an already flagged URL doesn't re-log it."""
+        handler = DynamicRemoteHandler(self.KEY)
+        assert handler.log.update_available is True
+        logged = []
+        monkeypatch.setattr(handler.log, "log_available_url", logged.append)
+
+        handler._check_for_updates()
+
+        assert logged == []
+        assert handler.log.available_url == _FakeHandler.fake_url
+        assert handler.log.last_check is not None
+
+
 class TestDynamicRemoteHandlerDiscoverError:
     """Test error handling in discover_latest_url."""
 
@@ -434,10 +528,105 @@ class TestDynamicRemoteHandlerDiscoverError:
         class _BrokenHandler:
             @property
             def latest_index_label_url(self):
-                raise RuntimeError("scrape failed")
+                raise URLError("scrape failed")
 
         monkeypatch.setitem(DYNAMIC_URL_HANDLERS, self.KEY, _BrokenHandler)
 
         handler = DynamicRemoteHandler(self.KEY)
         result = handler.discover_latest_url()
         assert result is None
+
+    def test_discover_lets_handler_bugs_propagate(self, monkeypatch):
+        class _BuggyHandler:
+            @property
+            def latest_index_label_url(self):
+                raise TypeError("bad handler")
+
+        monkeypatch.setitem(DYNAMIC_URL_HANDLERS, self.KEY, _BuggyHandler)
+
+        with pytest.raises(TypeError, match="bad handler"):
+            check_for_updates([self.KEY])
+
+
+class TestCheckForUpdates:
+    """Batch checking of several dynamic indexes."""
+
+    KEYS = ("test.fake.edr", "test.other.edr")
+
+    @pytest.fixture(autouse=True)
+    def _register_fakes(self, monkeypatch):
+        for key in self.KEYS:
+            monkeypatch.setitem(DYNAMIC_URL_HANDLERS, key, _FakeHandler)
+
+    def test_logs_every_key(self):
+        result = check_for_updates(self.KEYS)
+
+        assert result == {key: True for key in self.KEYS}
+        for key in self.KEYS:
+            log = AccessLog(key)
+            assert log.available_url == _FakeHandler.fake_url
+            assert log.last_check is not None
+
+    def test_logs_every_key_to_an_sqlite_log(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(AccessLog, "FILE_PATH", tmp_path / "test_log.sqlite")
+
+        assert check_for_updates(self.KEYS) == {key: True for key in self.KEYS}
+        for key in self.KEYS:
+            assert AccessLog(key).available_url == _FakeHandler.fake_url
+
+    def test_results_are_written_in_one_go(self, monkeypatch):
+        writes = []
+        monkeypatch.setattr(
+            "planetarypy.pds.index_logging.write_toml",
+            lambda path, doc: writes.append(doc),
+        )
+
+        check_for_updates(self.KEYS)
+
+        assert len(writes) == 1
+        entries = writes[0]["test"]
+        assert entries["fake"]["edr"]["available_url"] == _FakeHandler.fake_url
+        assert entries["other"]["edr"]["available_url"] == _FakeHandler.fake_url
+
+    def test_discoveries_run_concurrently(self, monkeypatch):
+        barrier = threading.Barrier(len(self.KEYS), timeout=5)
+
+        class _WaitingHandler(_FakeHandler):
+            @property
+            def latest_index_label_url(self):
+                # Only passes once every key is being discovered at the same time
+                barrier.wait()
+                return self.fake_url
+
+        for key in self.KEYS:
+            monkeypatch.setitem(DYNAMIC_URL_HANDLERS, key, _WaitingHandler)
+
+        assert all(check_for_updates(self.KEYS).values())
+
+    def test_skips_recently_checked(self, monkeypatch):
+        log = AccessLog(self.KEYS[0])
+        log.log_current_url(_FakeHandler.fake_url)
+        log.log_check_time()
+        discovered = []
+        monkeypatch.setattr(
+            "planetarypy.pds.dynamic_index.discover_latest_url",
+            lambda key: discovered.append(key) or _FakeHandler.fake_url,
+        )
+
+        result = check_for_updates(self.KEYS)
+
+        assert discovered == [self.KEYS[1]]
+        assert result == {self.KEYS[0]: False, self.KEYS[1]: True}
+
+    def test_force_checks_recently_checked(self, monkeypatch):
+        for key in self.KEYS:
+            AccessLog(key).log_check_time()
+        discovered = []
+        monkeypatch.setattr(
+            "planetarypy.pds.dynamic_index.discover_latest_url",
+            lambda key: discovered.append(key) or _FakeHandler.fake_url,
+        )
+
+        check_for_updates(self.KEYS, force=True)
+
+        assert sorted(discovered) == sorted(self.KEYS)
@@ -1,7 +1,11 @@
 """Tests for planetarypy.pds.index_fixes module."""
 
+import io
+import re
+
 import numpy as np
 import pandas as pd
+import pytest
 
 from planetarypy.pds.index_fixes import (
     apply_file_fixer,
@@ -12,6 +16,7 @@ from planetarypy.pds.index_fixes import (
     replace_in_dataframe,
     replace_in_file,
 )
+from planetarypy.pds import index_fixes
 
 
 # ---------------------------------------------------------------------------
@@ -55,11 +60,24 @@ class TestReplaceInDataFrame:
         result = replace_in_dataframe(df, r"\d+", "NUM", regex=True)
         assert result["A"].tolist() == ["abcNUM", "defNUM", "ghi"]
 
+    def test_accepts_a_compiled_pattern(self):
+        df = pd.DataFrame({"A": ["a1", "b"], "B": ["c22", "d3"]})
+        result = replace_in_dataframe(df, re.compile(r"\d+"), "N", regex=True)
+        assert result["A"].tolist() == ["aN", "b"]
+        assert result["B"].tolist() == ["cN", "dN"]
+
     def test_no_matches(self):
         df = self._sample_df()
         result = replace_in_dataframe(df, "NOMATCH", "XXX")
         assert result["A"].tolist() == ["foo bar", "baz foo", "hello"]
 
+    def test_unmatched_and_numeric_columns_keep_their_dtype(self):
+        df = self._sample_df()
+        result = replace_in_dataframe(df, "world", "XXX")
+        assert result["B"].tolist() == ["foo", "XXX", "foo"]
+        assert result["A"].dtype == df["A"].dtype
+        assert result["C"].dtype == df["C"].dtype
+
     def test_empty_dataframe(self):
         df = pd.DataFrame({"A": pd.Series([], dtype="object")})
         result = replace_in_dataframe(df, "foo", "bar")
@@ -91,6 +109,37 @@ class TestReplaceInFile:
         assert p.read_text() == "bbb"
 
 
+    def test_keeps_crlf_line_endings(self, tmp_path):
+        p = tmp_path / "data.tab"
+        p.write_bytes(b'a,-23.629",b\r\nc,d\r\n')
+        replace_in_file(p, '-23.629"', "-23.629,")
+        assert p.read_bytes() == b"a,-23.629,,b\r\nc,d\r\n"
+
+    def test_no_match_does_not_rewrite(self, tmp_path, monkeypatch):
+        p = tmp_path / "data.txt"
+        p.write_text("nothing here")
+        monkeypatch.setattr(index_fixes, "_stream_replace", lambda *a: pytest.fail("rewrote"))
+        replace_in_file(p, "MISSING", "X")
+        empty = tmp_path / "empty.txt"
+        empty.touch()
+        replace_in_file(empty, "X", "Y")
+        assert empty.read_bytes() == b""
+
+    def test_empty_old_text_is_rejected(self, tmp_path):
+        p = tmp_path / "data.txt"
+        p.write_text("abc")
+        with pytest.raises(ValueError):
+            replace_in_file(p, "", "X")
+        assert p.read_text() == "abc"
+        assert list(tmp_path.iterdir()) == [p]
+
+    def test_stream_replace_finds_matches_across_chunks(self):
+        src = io.BytesIO(b"xxabcxxabcabc")
+        dst = io.BytesIO()
+        index_fixes._stream_replace(src, dst, b"abc", b"-", chunk_size=2)
+        assert dst.getvalue() == b"xx-xx--"
+
+
 # ---------------------------------------------------------------------------
 # fix_go_ssi_file
 # ---------------------------------------------------------------------------
@@ -147,11 +196,33 @@ class TestFixMerRdrDf:
         result = fix_mer_rdr_df(df)
         assert result["A"].tolist() == ["hello"]
 
+    def test_leaves_missing_and_non_string_times_alone(self):
+        df = pd.DataFrame({
+            "START_TIME": ["2004-01-05T12:00:00", np.nan, 5],
+            "STOP_TIME": [np.nan, np.nan, np.nan],
+        })
+        result = fix_mer_rdr_df(df)
+        assert result["START_TIME"].iloc[0] == "2004-01-05T12:00:00Z"
+        assert pd.isna(result["START_TIME"].iloc[1])
+        assert result["START_TIME"].iloc[2] == 5
+        assert result["STOP_TIME"].isna().all()
+
     def test_does_not_modify_original(self):
         df = pd.DataFrame({"START_TIME": ["2004-01-05T12:00:00"]})
         fix_mer_rdr_df(df)
         assert df["START_TIME"].iloc[0] == "2004-01-05T12:00:00"
 
+    def test_untouched_columns_are_not_copied(self):
+        df = pd.DataFrame({
+            "START_TIME": ["2004-01-05T12:00:00"],
+            "RELEASE_ID": ["1"],
+            "SOL": [42],
+        })
+        result = fix_mer_rdr_df(df)
+        assert np.shares_memory(result["SOL"].to_numpy(), df["SOL"].to_numpy())
+        assert df["START_TIME"].iloc[0] == "2004-01-05T12:00:00"
+        assert df["RELEASE_ID"].iloc[0] == "1"
+
 
 # ---------------------------------------------------------------------------
 # fix_lro_lola_rdr_df
@@ -185,6 +256,15 @@ class TestFixLroLolaRdrDf:
         result = fix_lro_lola_rdr_df(df)
         assert pd.isna(result["PRODUCT_CREATION_TIME"].iloc[0])
 
+    def test_padded_values_and_none(self):
+        df = pd.DataFrame({
+            "PRODUCT_CREATION_TIME": [" 2010-06-15 ", None, "2010-06-15T01:02:03 "],
+        })
+        result = fix_lro_lola_rdr_df(df)["PRODUCT_CREATION_TIME"]
+        assert result.iloc[0] == pd.Timestamp("2010-06-15")
+        assert pd.isna(result.iloc[1])
+        assert result.iloc[2] == pd.Timestamp("2010-06-15 01:02:03")
+
     def test_missing_column_returns_unchanged(self):
         df = pd.DataFrame({"OTHER_COL": ["hello"]})
         result = fix_lro_lola_rdr_df(df)
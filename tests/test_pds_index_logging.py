@@ -4,16 +4,19 @@ from datetime import datetime, timedelta
 
 import pytest
 
-from planetarypy.pds.index_logging import AccessLog
+from planetarypy.pds.index_logging import AccessLog, SqliteAccessLog, batch_logs
 
 
 KEY = "mro.ctx.edr"
 
 
-@pytest.fixture()
-def access_log(tmp_path, monkeypatch):
-    """Return an AccessLog whose FILE_PATH points to a temp file."""
-    tmp_file = tmp_path / "test_index_log.toml"
+@pytest.fixture(params=["toml", "sqlite"])
+def access_log(request, tmp_path, monkeypatch):
+    """Return an AccessLog whose FILE_PATH points to a temp file.
+
+    Runs every test against both storage backends; the suffix picks one.
+    """
+    tmp_file = tmp_path / f"test_index_log.{request.param}"
     monkeypatch.setattr(AccessLog, "FILE_PATH", tmp_file)
     return AccessLog(KEY)
 
@@ -60,6 +63,14 @@ def test_log_update_time(access_log):
     assert before <= last <= after
 
 
+def test_shared_clock_reading_stamps_both_fields_alike(access_log):
+    now = datetime(2024, 5, 17, 12, 30, 45, 123456)
+    with access_log.batch():
+        access_log.log_update_time(now)
+        access_log.log_check_time(now)
+    assert access_log.last_update == access_log.last_check == now.replace(microsecond=0)
+
+
 # --- 4. log_current_url ---
 
 
@@ -87,6 +98,17 @@ def test_log_available_url(access_log):
     assert access_log.last_check is not None
 
 
+def test_log_available_url_writes_once(access_log, monkeypatch):
+    writes = []
+    write = access_log._write
+    monkeypatch.setattr(access_log, "_write", lambda: writes.append(write()))
+
+    access_log.log_available_url("https://example.com/data/new_index.tab")
+
+    assert len(writes) == 1
+    assert AccessLog(KEY).update_available is True
+
+
 # --- 6. log_update_available ---
 
 
@@ -218,6 +240,23 @@ def test_str_with_key(access_log):
     assert isinstance(s, str)
 
 
+def test_str_with_key_round_trips_through_tomllib(access_log):
+    import tomllib
+
+    access_log.log_current_url("https://example.com/a b.lbl")
+    access_log.log_check_time()
+    parsed = tomllib.loads(str(access_log))
+    assert parsed["mro"]["ctx"]["edr"]["current_url"] == "https://example.com/a b.lbl"
+    assert parsed["mro"]["ctx"]["edr"]["last_checked"] == access_log.last_check
+
+
+def test_repr_is_concise(access_log):
+    access_log.log_check_time()
+    shown = repr(access_log)
+    assert shown.startswith(f"<{type(access_log).__name__} key='mro.ctx.edr' path=")
+    assert "last_checked" not in shown
+
+
 def test_str_without_key(access_log):
     """When key is None, __str__ reads the file directly."""
     access_log.log_check_time()
@@ -248,3 +287,129 @@ def test_multiple_keys_independent(tmp_path, monkeypatch):
     reloaded_b = AccessLog("cassini.iss.raw")
     assert reloaded_a.current_url == "https://a.example.com"
     assert reloaded_b.current_url == "https://b.example.com"
+
+
+def test_batch_logs_over_two_keys_on_one_file(access_log):
+    other = AccessLog("mro.ctx.other")
+    now = datetime(2024, 5, 17, 12, 30)
+    with batch_logs([access_log, other]):
+        access_log.log_check_time(now)
+        other.log_check_time(now)
+        other.log_current_url("https://example.com/b.lbl")
+
+    assert AccessLog(KEY).last_check == now
+    assert AccessLog("mro.ctx.other").last_check == now
+    assert AccessLog("mro.ctx.other").current_url == "https://example.com/b.lbl"
+
+
+# --- Extra: SQLite backend ---
+
+
+def test_sqlite_suffix_selects_sqlite_backend(tmp_path, monkeypatch):
+    monkeypatch.setattr(AccessLog, "FILE_PATH", tmp_path / "log.db")
+    assert type(AccessLog(KEY)) is SqliteAccessLog
+    monkeypatch.setattr(AccessLog, "FILE_PATH", tmp_path / "log.toml")
+    assert type(AccessLog(KEY)) is AccessLog
+
+
+def test_sqlite_round_trips_value_types(tmp_path, monkeypatch):
+    monkeypatch.setattr(AccessLog, "FILE_PATH", tmp_path / "log.sqlite")
+    ts = datetime(2025, 6, 15, 12, 30, 0)
+    log = AccessLog(KEY)
+    log.set(KEY, "remote_timestamp", ts)
+    log.set(KEY, "update_available", False)
+    log.set(KEY, "current_url", "https://example.com/a.lbl")
+    log.save()
+
+    reloaded = AccessLog(KEY)
+    assert reloaded.get(KEY, "remote_timestamp") == ts
+    assert reloaded.get(KEY, "update_available") is False
+    assert reloaded.current_url == "https://example.com/a.lbl"
+    assert reloaded.to_dict() == {
+        "mro": {"ctx": {"edr": {
+            "current_url": "https://example.com/a.lbl",
+            "remote_timestamp": ts,
+            "update_available": False,
+        }}}
+    }
+
+
+def test_last_activity_is_latest_of_check_and_update(access_log):
+    assert access_log.last_activity is None
+    earlier = datetime(2025, 1, 1, 12, 0)
+    later = datetime(2025, 1, 2, 12, 0)
+    access_log.set(KEY, "last_updated", later)
+    access_log.set(KEY, "last_checked", earlier)
+    assert access_log.last_activity == later
+    access_log.set(KEY, "last_checked", later + timedelta(hours=1))
+    assert access_log.last_activity == later + timedelta(hours=1)
+
+
+def test_is_due_uses_the_given_clock(access_log):
+    access_log.log_check_time()
+    last = access_log.last_check
+    assert access_log.is_due(last + timedelta(hours=23)) is False
+    assert access_log.is_due(last + timedelta(hours=25)) is True
+
+
+def test_keyed_toml_log_loads_only_its_own_entry(tmp_path, monkeypatch):
+    monkeypatch.setattr(AccessLog, "FILE_PATH", tmp_path / "log.toml")
+    AccessLog(KEY).log_update_time()
+    AccessLog("mro.ctx.other").log_check_time()
+
+    reloaded = AccessLog(KEY)
+    assert reloaded.last_update is not None
+    assert reloaded.to_dict() == {"mro": {"ctx": {"edr": reloaded.get(KEY)}}}
+
+
+def test_unchanged_toml_entry_is_not_rewritten(tmp_path, monkeypatch):
+    import planetarypy.pds.index_logging as index_logging
+
+    monkeypatch.setattr(AccessLog, "FILE_PATH", tmp_path / "log.toml")
+    now = datetime(2024, 5, 17, 12, 30)
+    AccessLog(KEY).log_check_time(now)
+
+    writes = []
+    monkeypatch.setattr(index_logging, "write_toml", lambda *a: writes.append(a))
+    AccessLog(KEY).log_check_time(now)
+    assert writes == []
+    AccessLog(KEY).log_check_time(now + timedelta(seconds=1))
+    assert len(writes) == 1
+
+
+def test_keyed_toml_log_holds_plain_values(tmp_path, monkeypatch):
+    monkeypatch.setattr(AccessLog, "FILE_PATH", tmp_path / "log.toml")
+    AccessLog(KEY).log_update_available(True)
+
+    log = AccessLog(KEY)
+    assert type(log.get(KEY)) is dict
+    assert log.update_available is True
+    log.log_current_url("https://example.com/x.lbl")
+    assert type(log.current_url) is str
+
+
+def test_two_sqlite_logs_on_one_file_do_not_lock_each_other(tmp_path, monkeypatch):
+    monkeypatch.setattr(AccessLog, "FILE_PATH", tmp_path / "log.sqlite")
+    a = AccessLog(KEY)
+    b = AccessLog("mro.ctx.other")
+    # An unsaved set on one instance used to hold a write lock the other hit
+    a.log_current_url("https://example.com/a.lbl")
+    b.log_check_time()
+    a.save()
+
+    assert AccessLog(KEY).current_url == "https://example.com/a.lbl"
+    assert AccessLog("mro.ctx.other").last_check is not None
+
+
+def test_index_log_path_expands_user(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    env = {**os.environ, "HOME": str(tmp_path), "PLANETARYPY_INDEX_LOG": "~/log.sqlite"}
+    code = (
+        "from pathlib import Path; "
+        "from planetarypy.pds.index_logging import AccessLog; "
+        "assert AccessLog.FILE_PATH == Path.home() / 'log.sqlite', AccessLog.FILE_PATH"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
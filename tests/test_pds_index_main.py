@@ -17,7 +17,7 @@ from planetarypy.pds.index_main import Index, InventoryIndex
 def _patch_storage_root(tmp_path, monkeypatch):
     """Redirect config.storage_root to a temp directory for every test."""
     monkeypatch.setattr(
-        "planetarypy.pds.index_main.config.storage_root", tmp_path
+        "planetarypy.config.config.storage_root", tmp_path
     )
 
 
@@ -125,6 +125,19 @@ class TestFilenameProperties:
     def test_table_url_uppercase(self, upper_index):
         assert upper_index.table_url == "https://pds.example.com/go/ssi/CUMINDEX.TAB"
 
+    def test_label_filename_looks_up_the_url_once(self, static_index):
+        lookups = []
+
+        class _Remote:
+            @property
+            def url(self):
+                lookups.append(1)
+                return "https://pds.example.com/go/ssi/cumindex.lbl"
+
+        static_index._remote = _Remote()
+        assert static_index.label_filename == Path("cumindex.lbl")
+        assert len(lookups) == 1
+
 
 # ---------------------------------------------------------------------------
 # Local path computation
@@ -204,10 +217,21 @@ class TestDownload:
             static_index.download()
 
         assert mock_retrieve.call_count == 2
-        # First call: label URL
-        assert "cumindex.lbl" in str(mock_retrieve.call_args_list[0])
-        # Second call: table URL
-        assert "cumindex.tab" in str(mock_retrieve.call_args_list[1])
+        # Label and table are fetched concurrently, so in no fixed order
+        urls = sorted(str(c.args[0]) for c in mock_retrieve.call_args_list)
+        assert urls[0].endswith("cumindex.lbl")
+        assert urls[1].endswith("cumindex.tab")
+
+    @patch("planetarypy.pds.index_main.url_retrieve")
+    @patch("planetarypy.pds.index_main.have_internet", return_value=True)
+    def test_download_raises_if_either_file_fails(self, _inet, mock_retrieve, static_index):
+        def fake_retrieve(url, outfile, **kwargs):
+            if str(url).endswith(".tab"):
+                raise ConnectionError("Could not download table")
+
+        mock_retrieve.side_effect = fake_retrieve
+        with pytest.raises(ConnectionError, match="table"):
+            static_index.download()
 
     @patch("planetarypy.pds.index_main.url_retrieve")
     @patch("planetarypy.pds.index_main.have_internet", return_value=False)
@@ -1,6 +1,9 @@
 """Tests for planetarypy.pds.static_index module."""
 
 import datetime
+import os
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -8,6 +11,7 @@ import pytest
 import tomlkit
 from yarl import URL
 
+from planetarypy import utils
 from planetarypy.pds.static_index import ConfigHandler, StaticRemoteHandler
 from planetarypy.pds.index_logging import AccessLog
 
@@ -43,6 +47,12 @@ def config_env(tmp_path, monkeypatch):
     return {"config_path": config_path, "log_path": log_path, "tmp_path": tmp_path}
 
 
+def _age_file(path, days):
+    """Backdate a file's mtime, as if it was written ``days`` ago."""
+    stamp = time.time() - days * 86400
+    os.utime(path, (stamp, stamp))
+
+
 # ---------------------------------------------------------------------------
 # ConfigHandler tests
 # ---------------------------------------------------------------------------
@@ -60,6 +70,16 @@ class TestConfigHandler:
             handler = ConfigHandler()
         assert handler.path == config_env["config_path"]
 
+    def test_parses_into_plain_dicts(self, config_env):
+        """The URL config is only read, so it skips tomlkit's rich document."""
+        with patch.object(
+            ConfigHandler, "should_update",
+            new_callable=lambda: property(lambda self: False),
+        ):
+            handler = ConfigHandler()
+        assert type(handler.doc) is dict
+        assert type(handler.get("mro.ctx")) is dict
+
     def test_get_url_returns_correct_url(self, config_env):
         """get_url returns a yarl.URL for a dotted key."""
         with patch.object(
@@ -71,6 +91,55 @@ class TestConfigHandler:
         assert isinstance(url, URL)
         assert str(url) == "https://example.com/mro/ctx/edr_index.lbl"
 
+    def test_urls_is_flat_dotted_mapping(self, config_env):
+        """urls maps every leaf dotted key straight to its URL string."""
+        with patch.object(
+            ConfigHandler, "should_update",
+            new_callable=lambda: property(lambda self: False),
+        ):
+            handler = ConfigHandler()
+        assert handler.urls == {
+            "mro.ctx.edr": "https://example.com/mro/ctx/edr_index.lbl",
+            "mro.hirise.edr": handler.get("mro.hirise", "edr"),
+            "cassini.iss.ring_summary": "https://example.com/cassini/iss/ring_summary.lbl",
+        }
+
+    def test_urls_mapping_is_shared_until_the_file_changes(self, config_env):
+        """Handlers reading the same unchanged file share one flat mapping."""
+        with patch.object(
+            ConfigHandler, "should_update",
+            new_callable=lambda: property(lambda self: False),
+        ):
+            first = ConfigHandler().urls
+            assert ConfigHandler().urls is first
+            config_env["config_path"].write_text(
+                SAMPLE_TOML + '\n[go.ssi]\nraw = "https://example.com/go.lbl"\n',
+                encoding="utf-8",
+            )
+            changed = ConfigHandler().urls
+        assert changed is not first
+        assert changed["go.ssi.raw"] == "https://example.com/go.lbl"
+
+    def test_urls_mapping_is_read_only(self, config_env):
+        """The shared mapping can't be changed through one handler."""
+        with patch.object(
+            ConfigHandler, "should_update",
+            new_callable=lambda: property(lambda self: False),
+        ):
+            urls = ConfigHandler().urls
+            with pytest.raises(TypeError):
+                urls["mro.ctx.edr"] = "https://example.com/other.lbl"
+
+    def test_get_url_is_memoized_across_handlers(self, config_env):
+        """Repeated lookups reuse the parsed URL instead of re-parsing it."""
+        with patch.object(
+            ConfigHandler, "should_update",
+            new_callable=lambda: property(lambda self: False),
+        ):
+            first = ConfigHandler().get_url("mro.ctx.edr")
+            second = ConfigHandler().get_url("mro.ctx.edr")
+        assert first is second
+
     def test_get_url_different_key(self, config_env):
         """get_url works for different dotted keys."""
         with patch.object(
@@ -141,18 +210,161 @@ class TestConfigHandler:
         handler.log.save()
         assert handler.should_update is True
 
+    def test_daily_check_runs_in_background(self, config_env, monkeypatch):
+        """A due check does not block construction and runs on another thread."""
+        monkeypatch.delenv("PLANETARYPY_SYNC_CONFIG_CHECK")
+        release = threading.Event()
+        ran_on = []
+
+        def slow_check(self):
+            release.wait(5)
+            ran_on.append(threading.current_thread().name)
+
+        monkeypatch.setattr(ConfigHandler, "_check_and_update_config", slow_check)
+        _age_file(config_env["config_path"], days=2)
+        handler = ConfigHandler()
+        assert str(handler.get_url("mro.ctx.edr")).endswith("edr_index.lbl")
+        assert ran_on == []
+
+        release.set()
+        ConfigHandler.wait_for_update_check(timeout=5)
+        assert ran_on == ["planetarypy-config-check"]
+
+    def test_background_check_logs_to_an_sqlite_log(self, config_env, monkeypatch):
+        """The check thread writes through the log built on the calling thread."""
+        monkeypatch.delenv("PLANETARYPY_SYNC_CONFIG_CHECK")
+        monkeypatch.setattr(AccessLog, "FILE_PATH", config_env["tmp_path"] / "log.sqlite")
+        monkeypatch.setattr(
+            "planetarypy.pds.static_index.utils.compare_remote_file",
+            lambda *a, **k: {"has_updates": False, "remote_tmp_path": None, "error": None},
+        )
+        _age_file(config_env["config_path"], days=2)
+
+        ConfigHandler()
+        ConfigHandler.wait_for_update_check(timeout=5)
+
+        assert AccessLog("indexes.static.config").last_check is not None
+
+    def test_exit_hook_removes_the_download_of_an_unfinished_check(
+        self, config_env, monkeypatch
+    ):
+        monkeypatch.delenv("PLANETARYPY_SYNC_CONFIG_CHECK")
+        monkeypatch.setattr(ConfigHandler, "EXIT_WAIT", 0.01)
+        release = threading.Event()
+        tmp = utils._remote_tmp_path(config_env["config_path"])
+
+        def stuck_check(self):
+            tmp.write_text("partial")
+            release.wait(5)
+
+        monkeypatch.setattr(ConfigHandler, "_check_and_update_config", stuck_check)
+        _age_file(config_env["config_path"], days=2)
+        ConfigHandler()
+        try:
+            while not tmp.exists():
+                time.sleep(0.01)
+            ConfigHandler._finish_update_check()
+            assert not tmp.exists()
+        finally:
+            release.set()
+            ConfigHandler.wait_for_update_check(timeout=5)
+
+    def test_recently_replaced_file_skips_the_access_log(self, config_env, monkeypatch):
+        """A config written within the day is not due, without reading the log."""
+        monkeypatch.setattr(
+            ConfigHandler, "should_update",
+            property(lambda self: pytest.fail("the log should not be consulted")),
+        )
+        ConfigHandler()
+
+    def test_old_file_falls_back_to_the_access_log(self, config_env, monkeypatch):
+        """An older file may still have been checked recently; the log decides."""
+        _age_file(config_env["config_path"], days=2)
+        AccessLog("indexes.static.config").log_check_time()
+        checks = []
+        monkeypatch.setattr(ConfigHandler, "_start_update_check", lambda self: checks.append(self))
+        ConfigHandler()
+        assert checks == []
+
+    def test_access_log_writes_do_not_clobber_each_other(self, config_env):
+        """A stale AccessLog instance only writes its own entry back."""
+        config_log = AccessLog("indexes.static.config")
+        index_log = AccessLog("mro.ctx.edr")
+        config_log.log_check_time()
+        index_log.log_update_time()
+
+        assert AccessLog("indexes.static.config").last_check is not None
+        assert AccessLog("mro.ctx.edr").last_update is not None
+
+    def test_should_update_false_when_recently_checked(self, config_env):
+        """A recent check without changes counts, not just the last download."""
+        handler = ConfigHandler.__new__(ConfigHandler)
+        handler.log = AccessLog("indexes.static.config")
+        two_days_ago = datetime.datetime.now() - datetime.timedelta(days=2)
+        handler.log.set("indexes.static.config", "last_updated", two_days_ago)
+        handler.log.log_check_time()
+        assert handler.should_update is False
+
+    def test_should_update_threshold_is_jittered(self, config_env, monkeypatch):
+        """The one-day threshold moves by up to UPDATE_JITTER either way."""
+        handler = ConfigHandler.__new__(ConfigHandler)
+        handler.log = AccessLog("indexes.static.config")
+        just_over_a_day = datetime.datetime.now() - datetime.timedelta(hours=25)
+        handler.log.set("indexes.static.config", "last_updated", just_over_a_day)
+
+        monkeypatch.setattr("planetarypy.pds.static_index.random.uniform", lambda a, b: b)
+        assert handler.should_update is False
+        monkeypatch.setattr("planetarypy.pds.static_index.random.uniform", lambda a, b: a)
+        assert handler.should_update is True
+
     def test_downloads_config_when_missing(self, config_env, monkeypatch):
         """When config file does not exist, it is downloaded."""
         config_env["config_path"].unlink()
         assert not config_env["config_path"].exists()
 
-        def fake_url_retrieve(url, path, **kwargs):
-            Path(path).write_text(SAMPLE_TOML, encoding="utf-8")
+        def fake_compare(url, path, **kwargs):
+            tmp = Path(path).with_suffix(".remote_tmp.toml")
+            tmp.write_text(SAMPLE_TOML, encoding="utf-8")
+            return {
+                "has_updates": True, "remote_tmp_path": tmp, "error": None,
+                "etag": '"first"', "last_modified": None,
+            }
 
-        monkeypatch.setattr("planetarypy.pds.static_index.utils.url_retrieve", fake_url_retrieve)
+        monkeypatch.setattr(
+            "planetarypy.pds.static_index.utils.compare_remote_file", fake_compare
+        )
         handler = ConfigHandler()
         assert config_env["config_path"].exists()
         assert str(handler.get_url("mro.ctx.edr")) == "https://example.com/mro/ctx/edr_index.lbl"
+        # The first daily check can already be conditional
+        assert handler.log.etag == '"first"'
+        assert handler.log.last_update is not None
+
+    def test_failed_first_download_raises(self, config_env, monkeypatch):
+        """Without a local config there is nothing to fall back to."""
+        config_env["config_path"].unlink()
+        monkeypatch.setattr(
+            "planetarypy.pds.static_index.utils.compare_remote_file",
+            lambda *a, **kw: {
+                "has_updates": False, "remote_tmp_path": None, "error": "Network error",
+            },
+        )
+        with pytest.raises(ConnectionError, match="Network error"):
+            ConfigHandler()
+
+    def test_invalid_first_download_is_not_installed(self, config_env, monkeypatch):
+        """A broken download raises and leaves no config behind to be reused."""
+        config_env["config_path"].unlink()
+        tmp = config_env["tmp_path"] / "remote_tmp.toml"
+        tmp.write_text("[mro\nctx = ", encoding="utf-8")
+        monkeypatch.setattr(
+            "planetarypy.pds.static_index.utils.compare_remote_file",
+            lambda *a, **kw: {"has_updates": True, "remote_tmp_path": tmp, "error": None},
+        )
+        with pytest.raises(ConnectionError, match="invalid config"):
+            ConfigHandler()
+        assert not config_env["config_path"].exists()
+        assert not tmp.exists()
 
     def test_check_and_update_config_with_updates(self, config_env, monkeypatch):
         """_check_and_update_config replaces the file when remote differs."""
@@ -191,6 +403,51 @@ class TestConfigHandler:
         # Should have logged a check time
         assert handler.log.last_check is not None
 
+    def test_check_and_update_config_rejects_invalid_toml(self, config_env, monkeypatch):
+        """A broken remote file is discarded and the local config kept."""
+        remote_tmp = config_env["tmp_path"] / "remote_tmp.toml"
+        remote_tmp.write_text("[mro\nbroken = ", encoding="utf-8")
+        monkeypatch.setattr(
+            "planetarypy.pds.static_index.utils.compare_remote_file",
+            lambda *a, **kw: {"has_updates": True, "remote_tmp_path": remote_tmp, "error": None},
+        )
+        with patch.object(
+            ConfigHandler, "should_update",
+            new_callable=lambda: property(lambda self: False),
+        ):
+            handler = ConfigHandler()
+
+        handler._check_and_update_config()
+
+        assert config_env["config_path"].read_text(encoding="utf-8") == SAMPLE_TOML
+        assert not remote_tmp.exists()
+        assert handler.log.last_check is not None
+
+    def test_check_and_update_config_reuses_validators(self, config_env, monkeypatch):
+        """Validators from one check are sent with the next one."""
+        calls = []
+
+        def fake_compare(url, path, etag=None, last_modified=None, **kw):
+            calls.append(etag)
+            return {
+                "has_updates": False, "remote_tmp_path": None, "error": None,
+                "etag": '"v1"', "last_modified": None,
+            }
+
+        monkeypatch.setattr(
+            "planetarypy.pds.static_index.utils.compare_remote_file", fake_compare
+        )
+        with patch.object(
+            ConfigHandler, "should_update",
+            new_callable=lambda: property(lambda self: False),
+        ):
+            handler = ConfigHandler()
+        handler._check_and_update_config()
+        handler._check_and_update_config()
+
+        assert calls == [None, '"v1"']
+        assert AccessLog("indexes.static.config").etag == '"v1"'
+
     def test_check_and_update_config_error(self, config_env, monkeypatch):
         """_check_and_update_config handles errors gracefully."""
         monkeypatch.setattr(
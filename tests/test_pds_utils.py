@@ -173,3 +173,33 @@ class TestValidateIndexKey:
         from planetarypy.pds.utils import check_index_key_shape
 
         assert check_index_key_shape("go.ssi.raw") == "go.ssi.raw"
+
+
+class TestPidNormalizer:
+    def test_matches_normalize_pid_with_index_prefix(self):
+        normalize = pds_utils._pid_normalizer("cassini.iss.index")
+        for value in ["1_N1454725799.122", "N1454725799", "/COISS/DATA/1_N1.LBL"]:
+            assert normalize(value) == pds_utils._normalize_pid(value, "cassini.iss.index")
+        assert normalize("1_N1454725799.122") == "N1454725799"
+
+    def test_looks_up_the_index_config_once(self, monkeypatch):
+        calls = []
+        real = pds_utils._index_config_for
+        monkeypatch.setattr(
+            pds_utils, "_index_config_for", lambda key: calls.append(key) or real(key)
+        )
+        normalize = pds_utils._pid_normalizer("cassini.iss.index")
+        [normalize(v) for v in ["1_A.1", "1_B.2", "1_C.3"]]
+        assert calls == ["cassini.iss.index"]
+
+    def test_without_index_key_only_strips_decoration(self):
+        assert pds_utils._pid_normalizer(None)("DIR/PROD.IMG") == "PROD"
+
+
+def test_importing_pds_does_not_import_pandas():
+    """pandas is loaded by the functions that build DataFrames, not on import."""
+    import subprocess
+    import sys
+
+    code = "import sys, planetarypy.pds; assert 'pandas' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
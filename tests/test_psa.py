@@ -8,6 +8,7 @@ import zipfile
 import pytest
 
 from planetarypy import psa
+from planetarypy.utils import http_session
 
 
 # ── query parsing ────────────────────────────────────────────────────
@@ -24,7 +25,7 @@ def test_query_parses_metadata_and_data(monkeypatch):
                 "data": [[1, 2], [3, 4]],
             }
 
-    monkeypatch.setattr(psa.requests, "get", lambda *a, **k: _Resp())
+    monkeypatch.setattr(http_session(), "get", lambda *a, **k: _Resp())
     assert psa.query("SELECT a,b FROM t") == [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
 
 
@@ -469,7 +470,7 @@ def test_fetch_direct_detached_label(tmp_path, monkeypatch):
     class Resp:
         text = '^SPREADSHEET = "PROD.CSV"\n^LABEL = "PROD.LBL"\n'
 
-    monkeypatch.setattr(psa.requests, "get", lambda url, **k: Resp())
+    monkeypatch.setattr(utils.http_session(), "get", lambda url, **k: Resp())
     seen = []
     monkeypatch.setattr(utils, "url_retrieve", _file_writer(seen))
 
@@ -80,6 +80,12 @@ def test_build_q_combines_filters():
     assert " and " in q
 
 
+def test_as_iso_parses_iso_and_free_form_dates():
+    assert search._as_iso("2020-01-01") == "2020-01-01T00:00:00"
+    assert search._as_iso("2020-01-01T12:00:00Z") == "2020-01-01T12:00:00+00:00"
+    assert search._as_iso("Jan 2 2020") == "2020-01-02T00:00:00"
+
+
 def test_build_q_bbox_intersects():
     q = search._build_q(
         target=None, instrument=None, instrument_host=None, investigation=None,
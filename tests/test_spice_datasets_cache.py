@@ -1,10 +1,23 @@
 import os
+import time
+from datetime import datetime, timedelta
+
 import pandas as pd
 import pytest
 
 pytest.importorskip("spiceypy")
 
 
+class _FakePageResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = "<html></html>"
+
+    def raise_for_status(self):
+        pass
+
+
 # Skip in parallel mode - this test needs fresh module imports
 @pytest.mark.skipif(
     os.environ.get("PYTEST_XDIST_WORKER") is not None,
@@ -99,6 +112,9 @@ def test_fresh_parse_coerces_data_size_to_numeric(tmp_path, monkeypatch):
         columns=[(c, None) for c in cols],
     )
     monkeypatch.setattr(pd, "read_html", lambda *a, **k: [None] * 6 + [table])
+    monkeypatch.setattr(
+        ak_mod.http_session(), "get", lambda *a, **k: _FakePageResponse(200)
+    )
 
     from planetarypy.spice.archived_kernels import get_datasets
     out = get_datasets()
@@ -107,3 +123,65 @@ def test_fresh_parse_coerces_data_size_to_numeric(tmp_path, monkeypatch):
         "Data Size (GB) must be numeric on the fresh-parse path"
     )
     assert out.loc["Cassini", "Data Size (GB)"] == 73.5
+
+
+@pytest.mark.skipif(
+    os.environ.get("PYTEST_XDIST_WORKER") is not None,
+    reason="Test requires isolated module imports, skip in parallel mode"
+)
+def test_unchanged_page_reuses_cache(tmp_path, monkeypatch):
+    """A 304 for the stored validators keeps the cached table, unparsed."""
+    from planetarypy.pds.index_logging import AccessLog
+    import planetarypy.spice.archived_kernels as ak_mod
+
+    cache_path = tmp_path / "archived_spice_datasets.csv"
+    monkeypatch.setattr(ak_mod, "DATASETS_CACHE", cache_path)
+    monkeypatch.setattr(AccessLog, "FILE_PATH", tmp_path / "index_log.toml")
+    pd.DataFrame(
+        {"Mission Name": ["Mars Express"], "Data Size (GB)": [0.8]}
+    ).set_index("Mission Name").to_csv(cache_path)
+    two_days_ago = time.time() - 2 * 86400
+    os.utime(cache_path, (two_days_ago, two_days_ago))
+
+    log = AccessLog("spice.archived_kernels.datasets")
+    log.log_validators('"page-v1"', None)
+    log.set(log.key, "last_checked", datetime.now() - timedelta(days=2))
+    log.save()
+
+    sent = {}
+
+    def fake_get(url, headers=None, **kwargs):
+        sent.update(headers)
+        return _FakePageResponse(304)
+
+    def fail_read_html(*args, **kwargs):
+        raise AssertionError("an unchanged page must not be parsed")
+
+    monkeypatch.setattr(ak_mod.http_session(), "get", fake_get)
+    monkeypatch.setattr(pd, "read_html", fail_read_html)
+
+    out = ak_mod.get_datasets()
+
+    assert sent["If-None-Match"] == '"page-v1"'
+    assert list(out.index) == ["Mars Express"]
+    assert not AccessLog("spice.archived_kernels.datasets").should_check
+
+
+def test_recent_download_skips_the_access_log(tmp_path, monkeypatch):
+    """A table written within the last day is used without reading the log."""
+    from planetarypy.pds.index_logging import AccessLog
+    import planetarypy.spice.archived_kernels as ak_mod
+
+    cache_path = tmp_path / "archived_spice_datasets.csv"
+    monkeypatch.setattr(ak_mod, "DATASETS_CACHE", cache_path)
+    pd.DataFrame(
+        {"Mission Name": ["Mars Express"], "Data Size (GB)": [0.8]}
+    ).set_index("Mission Name").to_csv(cache_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("a fresh cache needs neither the log nor NAIF")
+
+    monkeypatch.setattr(AccessLog, "__init__", fail)
+    monkeypatch.setattr(ak_mod.http_session(), "get", fail)
+
+    assert list(ak_mod.get_datasets().index) == ["Mars Express"]
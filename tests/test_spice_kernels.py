@@ -13,6 +13,24 @@ def test_receive_datasets_dataframe():
     assert isinstance(kernels.datasets, pd.DataFrame)
 
 
+def test_datasets_is_fetched_on_first_access_only(monkeypatch):
+    table = pd.DataFrame(
+        {"Mission Name": ["Cassini Orbiter"], "Start Time": ["1997-10-15"]}
+    )
+    calls = []
+    monkeypatch.setattr(
+        kernels, "get_datasets", lambda: calls.append(1) or table
+    )
+    kernels._load_datasets.cache_clear()
+    try:
+        assert "datasets" not in vars(kernels)
+        assert kernels.datasets is kernels.datasets
+        assert list(kernels.datasets.index) == ["cassini"]
+        assert calls == [1]
+    finally:
+        kernels._load_datasets.cache_clear()
+
+
 def test_cassini_valid_times():
     assert kernels._is_start_valid("cassini", Time("1998-01-01")) is True
     assert kernels._is_start_valid("cassini", Time("1997-01-01")) is False
@@ -1,5 +1,6 @@
 """Tests for utils module."""
 
+import datetime as dt
 from pathlib import Path
 import pytest
 
@@ -69,7 +70,7 @@ class _FakeResponse:
 def test_url_retrieve_writes_file_and_cleans_part(tmp_path, monkeypatch):
     payload = b"hello world"
     monkeypatch.setattr(
-        utils.requests, "get", lambda *a, **k: _FakeResponse(payload)
+        utils.http_session(), "get", lambda *a, **k: _FakeResponse(payload)
     )
     outfile = tmp_path / "data.bin"
     utils.url_retrieve(
@@ -85,6 +86,170 @@ def test_url_retrieve_writes_file_and_cleans_part(tmp_path, monkeypatch):
     outfile.replace(tmp_path / "data2.bin")
 
 
+def test_http_session_is_shared_and_retries():
+    session = utils.http_session()
+    assert utils.http_session() is session
+    adapter = session.get_adapter("https://example.invalid/")
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+class _FailingConnection:
+    def __init__(self, error):
+        self.error = error
+
+    def request(self, method, url):
+        raise self.error
+
+    def close(self):
+        pass
+
+
+def test_have_internet_is_false_on_network_errors(monkeypatch):
+    monkeypatch.setattr(
+        utils.httplib, "HTTPConnection",
+        lambda *a, **k: _FailingConnection(TimeoutError("timed out")),
+    )
+    assert utils.have_internet() is False
+
+
+def test_have_internet_lets_bugs_through(monkeypatch):
+    monkeypatch.setattr(
+        utils.httplib, "HTTPConnection",
+        lambda *a, **k: _FailingConnection(TypeError("bug")),
+    )
+    with pytest.raises(TypeError):
+        utils.have_internet()
+
+
+class _FakeTextResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        data = self.text.encode("utf-8")
+        for i in range(0, len(data), chunk_size):
+            yield data[i : i + chunk_size]
+
+
+class TestGetRemoteTimestamp:
+    LAST_MODIFIED = "Wed, 01 Jan 2025 12:00:00 GMT"
+
+    def test_reads_last_modified_from_a_head_request(self, monkeypatch):
+        session = utils.http_session()
+        monkeypatch.setattr(
+            session, "head",
+            lambda *a, **k: _FakeTextResponse(200, headers={"Last-Modified": self.LAST_MODIFIED}),
+        )
+        monkeypatch.setattr(
+            session, "get", lambda *a, **k: pytest.fail("no GET when HEAD works")
+        )
+        stamp = utils.get_remote_timestamp("http://example.invalid/index.lbl")
+        assert stamp == dt.datetime(2025, 1, 1, 12, 0)
+
+    def test_falls_back_to_get_when_head_is_refused(self, monkeypatch):
+        session = utils.http_session()
+        monkeypatch.setattr(session, "head", lambda *a, **k: _FakeTextResponse(405))
+        monkeypatch.setattr(
+            session, "get",
+            lambda *a, **k: _FakeTextResponse(200, headers={"Last-Modified": self.LAST_MODIFIED}),
+        )
+        stamp = utils.get_remote_timestamp("http://example.invalid/index.lbl")
+        assert stamp == dt.datetime(2025, 1, 1, 12, 0)
+
+    def test_missing_header_is_a_url_error(self, monkeypatch):
+        from urllib.error import URLError
+
+        monkeypatch.setattr(
+            utils.http_session(), "head", lambda *a, **k: _FakeTextResponse(200)
+        )
+        with pytest.raises(URLError, match="Last-Modified"):
+            utils.get_remote_timestamp("http://example.invalid/index.lbl")
+
+
+class TestCompareRemoteFile:
+    def test_sends_validators_and_treats_304_as_unchanged(self, tmp_path, monkeypatch):
+        sent = {}
+
+        def fake_get(url, headers=None, **kwargs):
+            sent.update(headers)
+            return _FakeTextResponse(304)
+
+        monkeypatch.setattr(utils.http_session(), "get", fake_get)
+        local = tmp_path / "cfg.toml"
+        local.write_text("a = 1\n", encoding="utf-8")
+
+        result = utils.compare_remote_file(
+            "http://example.invalid/cfg.toml", local,
+            etag='"abc"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT",
+        )
+
+        assert sent["If-None-Match"] == '"abc"'
+        assert sent["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+        assert result["has_updates"] is False
+        assert result["error"] is None
+        assert result["etag"] == '"abc"'
+
+    def test_full_response_returns_its_validators(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            utils.http_session(), "get",
+            lambda *a, **k: _FakeTextResponse(200, "a = 2\n", {"ETag": '"new"'}),
+        )
+        local = tmp_path / "cfg.toml"
+        local.write_text("a = 1\n", encoding="utf-8")
+
+        result = utils.compare_remote_file("http://example.invalid/cfg.toml", local)
+
+        assert result["has_updates"] is True
+        assert result["etag"] == '"new"'
+        assert result["last_modified"] is None
+        assert result["remote_tmp_path"].read_text(encoding="utf-8") == "a = 2\n"
+
+    def test_identical_content_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            utils.http_session(), "get",
+            lambda *a, **k: _FakeTextResponse(200, "a = 1\n"),
+        )
+        local = tmp_path / "cfg.toml"
+        local.write_text("a = 1\n", encoding="utf-8")
+
+        result = utils.compare_remote_file("http://example.invalid/cfg.toml", local)
+
+        assert result["has_updates"] is False
+        assert result["remote_tmp_path"] is None
+        assert list(tmp_path.iterdir()) == [local]
+
+    def test_different_length_skips_hashing_the_local_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            utils.http_session(), "get",
+            lambda *a, **k: _FakeTextResponse(200, "a = 10\n"),
+        )
+        monkeypatch.setattr(
+            utils.hashlib, "file_digest",
+            lambda *a: pytest.fail("local file was hashed"),
+        )
+        local = tmp_path / "cfg.toml"
+        local.write_text("a = 1\n", encoding="utf-8")
+
+        assert utils.compare_remote_file("http://x.invalid/c.toml", local)["has_updates"]
+        local.unlink()
+        assert utils.compare_remote_file("http://x.invalid/c.toml", local)["has_updates"]
+
+
 class TestUserAgent:
     """The UA is how archive operators identify our traffic in their logs."""
 
@@ -105,3 +270,172 @@ class TestUserAgent:
         from planetarypy.utils import headers, user_agent
 
         assert headers()["User-Agent"] == user_agent()
+
+
+class TestTomlDumps:
+    def test_round_trips_through_tomllib(self):
+        import tomllib
+
+        data = {
+            "version": 2,
+            "mro": {"ctx": {"edr": {
+                "last_checked": dt.datetime(2025, 1, 1, 12, 0),
+                "update_available": False,
+                "current_url": 'https://example.com/"quoted".lbl',
+                "ratio": 0.5,
+                "volumes": [1, 2],
+            }}},
+            "odd key": {"x": "y"},
+        }
+        assert tomllib.loads(utils.toml_dumps(data)) == data
+
+    def test_round_trips_non_ascii_and_control_characters(self):
+        import tomllib
+
+        data = {"Mars 🔴": {"target": "Pluto 🪐 Ørsted\ttab\x7fdel\x00nul"}}
+        assert tomllib.loads(utils.toml_dumps(data)) == data
+
+    def test_only_tables_with_values_get_a_header(self):
+        text = utils.toml_dumps({"mro": {"ctx": {"edr": {"a": 1}}}})
+        assert text == "[mro.ctx.edr]\na = 1\n"
+
+    def test_write_toml_matches_toml_dumps(self, tmp_path):
+        data = {"version": 2, "mro": {"ctx": {"edr": {"a": 1}}, "hirise": {"b": "x"}}}
+        path = tmp_path / "log.toml"
+        utils.write_toml(path, data)
+        assert path.read_text(encoding="utf-8") == utils.toml_dumps(data)
+        assert utils.toml_dumps(data) == (
+            'version = 2\n\n[mro.ctx.edr]\na = 1\n\n[mro.hirise]\nb = "x"\n'
+        )
+
+    def test_write_toml_refreshes_the_read_only_parse(self, tmp_path):
+        path = tmp_path / "log.toml"
+        utils.write_toml(path, {"a": 1})
+        assert utils.NestedTomlDict(path, read_only=True).doc == {"a": 1}
+        utils.write_toml(path, {"a": 2})
+        assert utils.NestedTomlDict(path, read_only=True).doc == {"a": 2}
+
+
+class TestNestedTomlDictBatch:
+    """``batch`` folds the saves inside it into one write."""
+
+    def test_writes_once_on_exit(self, tmp_path, monkeypatch):
+        doc = utils.NestedTomlDict(tmp_path / "doc.toml")
+        writes = []
+        monkeypatch.setattr(doc, "_write", lambda: writes.append(1))
+
+        with doc.batch():
+            doc.set("a.b", "x", 1)
+            doc.save()
+            with doc.batch():
+                doc.set("a.b", "y", 2)
+                doc.save()
+            assert writes == []
+
+        assert writes == [1]
+
+    def test_no_write_without_save(self, tmp_path):
+        path = tmp_path / "doc.toml"
+        doc = utils.NestedTomlDict(path)
+        with doc.batch():
+            doc.set("a.b", "x", 1)
+        assert not path.exists()
+
+    def test_flushes_on_error(self, tmp_path):
+        path = tmp_path / "doc.toml"
+        doc = utils.NestedTomlDict(path)
+        with pytest.raises(RuntimeError):
+            with doc.batch():
+                doc.set("a.b", "x", 1)
+                doc.save()
+                raise RuntimeError
+        assert utils.NestedTomlDict(path).get("a.b", "x") == 1
+
+
+def test_nested_toml_dict_writes_only_leaf_headers(tmp_path):
+    doc = utils.NestedTomlDict(tmp_path / "doc.toml")
+    doc.set("mro.ctx.edr", "x", 1)
+    doc.set("mro.hirise.edr", "x", 2)
+    assert doc.dumps() == "[mro.ctx.edr]\nx = 1\n\n[mro.hirise.edr]\nx = 2\n"
+
+    doc.save()
+    assert utils.NestedTomlDict(tmp_path / "doc.toml").to_dict() == {
+        "mro": {"ctx": {"edr": {"x": 1}}, "hirise": {"edr": {"x": 2}}}
+    }
+
+
+def test_nested_toml_dict_read_only(tmp_path):
+    path = tmp_path / "doc.toml"
+    path.write_text('[a.b]\nx = 1\n', encoding="utf-8")
+    doc = utils.NestedTomlDict(path, read_only=True)
+    assert type(doc.doc) is dict
+    assert doc.get("a.b", "x") == 1
+    assert utils.NestedTomlDict(tmp_path / "missing.toml", read_only=True).doc == {}
+
+
+def test_nested_toml_dict_read_only_to_dict_is_a_private_copy(tmp_path):
+    path = tmp_path / "doc.toml"
+    path.write_text('[a.b]\nx = 1\n', encoding="utf-8")
+    utils.NestedTomlDict(path, read_only=True).to_dict()["a"]["b"]["x"] = 2
+    assert utils.NestedTomlDict(path, read_only=True).get("a.b", "x") == 1
+
+
+class TestHoursSinceTimestamp:
+    def test_naive_is_local_wall_clock(self):
+        then = dt.datetime.now() - dt.timedelta(hours=3)
+        assert utils.calculate_hours_since_timestamp(then) == pytest.approx(3, abs=0.01)
+
+    def test_aware_is_compared_in_utc(self):
+        then = dt.datetime.now(dt.timezone(dt.timedelta(hours=5))) - dt.timedelta(hours=2)
+        assert utils.calculate_hours_since_timestamp(then) == pytest.approx(2, abs=0.01)
+
+    def test_shared_now(self):
+        now = dt.datetime(2025, 1, 2, 12)
+        assert utils.calculate_hours_since_timestamp(dt.datetime(2025, 1, 1, 12), now) == 24
+        assert utils.is_older_than_hours(dt.datetime(2025, 1, 1, 13), 24, now) is False
+
+
+def test_read_only_parse_is_reused_until_file_changes(tmp_path):
+    path = tmp_path / "doc.toml"
+    path.write_text("[a]\nx = 1\n", encoding="utf-8")
+    first = utils.NestedTomlDict(path, read_only=True)
+    second = utils.NestedTomlDict(path, read_only=True)
+    assert second.doc is first.doc
+
+    path.write_text("[a]\nx = 22\n", encoding="utf-8")
+    assert utils.NestedTomlDict(path, read_only=True).get("a", "x") == 22
+
+
+def test_atomic_write_keeps_existing_file_by_default(tmp_path):
+    path = tmp_path / "cache.txt"
+    path.write_text("first")
+    with utils.atomic_write(path) as tmp:
+        tmp.write_text("second")
+    assert path.read_text() == "first"
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_atomic_write_overwrite_replaces_existing_file(tmp_path):
+    path = tmp_path / "config.toml"
+    path.write_text("first")
+    with utils.atomic_write(path, overwrite=True) as tmp:
+        tmp.write_text("second")
+        # The target is untouched until the block completes
+        assert path.read_text() == "first"
+    assert path.read_text() == "second"
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_nested_toml_dict_set_on_a_plain_doc_keeps_plain_dicts(tmp_path):
+    doc = utils.NestedTomlDict(tmp_path / "doc.toml")
+    doc.doc = {}
+    doc.set("mro.ctx.edr", "x", 1)
+    assert doc.doc == {"mro": {"ctx": {"edr": {"x": 1}}}}
+    assert type(doc.doc["mro"]["ctx"]) is dict
+    assert doc.dumps() == "[mro.ctx.edr]\nx = 1\n"
+
+
+def test_nested_toml_dict_reads_utf8_regardless_of_locale(tmp_path):
+    path = tmp_path / "doc.toml"
+    path.write_bytes('[mro.ctx]\nname = "Mars Orbiter Caméra"\n'.encode("utf-8"))
+    assert utils.NestedTomlDict(path).get("mro.ctx", "name") == "Mars Orbiter Caméra"